@@ -0,0 +1,87 @@
+"""
+通用工具函数
+供各处理模块共用的并行执行、可序列化缓存、JSON写出等辅助工具
+"""
+
+import abc
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Tuple
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class CachedStateMixin(abc.ABC):
+    """
+    为持有运行期缓存的对象提供序列化支持（多进程时对象会被 pickle 到子进程）
+    
+    子类在 _TRANSIENT_ATTRS 中列出无法序列化的属性，并实现 _init_caches 重建它们；
+    pickle 时丢弃这些属性，反序列化后调用 _init_caches 重新创建。
+    """
+    
+    _TRANSIENT_ATTRS: Tuple[str, ...] = ()
+    
+    @abc.abstractmethod
+    def _init_caches(self):
+        """创建（或在反序列化后重建）_TRANSIENT_ATTRS 中列出的属性"""
+    
+    def __getstate__(self):
+        # lru_cache 包装的绑定方法、threading.local 等无法序列化，在子进程中重建
+        state = self.__dict__.copy()
+        for name in self._TRANSIENT_ATTRS:
+            state.pop(name, None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_caches()
+
+
+def resolve_workers(n_jobs: int) -> int:
+    """将 n_jobs 解析为进程数：-1 使用全部CPU核心，其余按原值"""
+    return (os.cpu_count() or 1) if n_jobs == -1 else n_jobs
+
+
+def run_chunked(func: Callable[[Any], List[Any]], items: Any, n_jobs: int = 1, min_items: int = 2) -> List[Any]:
+    """
+    将 items 分块交给多个进程执行 func，返回按原顺序拼接的结果列表
+    
+    func 接收一块 items 并返回该块的结果列表，必须可序列化（模块级函数、绑定方法或 functools.partial）。
+    items 可以是列表等序列，也可以是 DataFrame（按 iloc 切块）。
+    进程数不超过 1 或 items 少于 min_items 个时在当前进程直接返回 func(items)。
+    
+    Args:
+        func: 处理一块数据的函数
+        items: 待处理的数据
+        n_jobs: 并行进程数，1 为单进程，-1 使用全部CPU核心
+        min_items: 启用多进程所需的最少数据量
+    """
+    workers = resolve_workers(n_jobs)
+    if workers <= 1 or len(items) < min_items:
+        return func(items)
+    
+    # 每个进程分到多块，减小块间负载不均；结果按块顺序拼接，保持原顺序
+    chunk_size = max(1, -(-len(items) // (workers * 4)))
+    rows = getattr(items, 'iloc', items)
+    chunks = [rows[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [result for chunk_result in executor.map(func, chunks) for result in chunk_result]
+
+
+def write_json(data: Any, file_path: str):
+    """写出缩进为2的UTF-8 JSON；安装 orjson 时直接序列化为字节，无法序列化的数据退回标准库 json"""
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:
+            payload = None
+        if payload is not None:
+            with open(file_path, 'wb') as f:
+                f.write(payload)
+            return
+    
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
@@ -6,6 +6,7 @@
 """
 
 import re
+import functools
 import unicodedata
 from typing import List, Dict, Optional, Any, Tuple
 import logging
@@ -13,6 +14,48 @@ import json
 import pandas as pd
 
 
+# 试剂等级前缀（化学纯/分析纯等），可能连续出现多个，一次匹配全部移除
+_CHEM_PREFIX_RE = re.compile(r'^(?:(?:化学纯|分析纯|AR|CP|GR)\s*)+')
+
+# CAS号与流水号（纯数字，至少6位）的合并匹配，按命中的分组区分类型
+_IDENT_RE = re.compile(r'^(?P<cas>\d{2,7}-\d{2}-\d)$|^(?P<serial>\d{6,})$')
+
+
+@functools.lru_cache(maxsize=8192)
+def _classify_identifier(identifier_str: str) -> Dict[str, Any]:
+    """对非空标识符进行一次匹配分类（结果被缓存，调用方不应修改）"""
+    match = _IDENT_RE.match(identifier_str)
+    
+    # CAS号格式验证
+    if match and match.group('cas') is not None:
+        return {
+            'type': '标准CAS号',
+            'is_valid': True,
+            'formatted': identifier_str,
+            'needs_query': False,
+            'suggestion': 'CAS号格式正确，需验证准确性'
+        }
+    
+    # 流水号判断（纯数字）
+    if match:
+        return {
+            'type': '本地流水号',
+            'is_valid': True,
+            'formatted': identifier_str,
+            'needs_query': True,
+            'suggestion': '检测到本地流水号，建议查询对应的国际CAS号'
+        }
+    
+    # 格式异常
+    return {
+        'type': '格式异常',
+        'is_valid': False,
+        'formatted': identifier_str,
+        'needs_query': True,
+        'suggestion': f'编号格式不标准：{identifier_str}，需要重新查询验证'
+    }
+
+
 class StringUtils:
     """字符串工具类"""
     
@@ -43,11 +86,8 @@ class StringUtils:
         name = StringUtils.clean_text(name)
         
         # 移除常见的非必要前缀/后缀
-        prefixes_to_remove = ['化学纯', '分析纯', 'AR', 'CP', 'GR']
-        for prefix in prefixes_to_remove:
-            if name.startswith(prefix):
-                name = name[len(prefix):].strip()
-        
+        name = _CHEM_PREFIX_RE.sub('', name)
+
         # 标准化括号
         name = re.sub(r'[（\(]([^）\)]*)[）\)]', r'(\1)', name)
         
@@ -91,37 +131,8 @@ class StringUtils:
                 'suggestion': '需要查询补充标准CAS号'
             }
         
-        identifier_str = str(identifier).strip()
-        
-        # CAS号格式验证
-        cas_pattern = r'^\d{2,7}-\d{2}-\d$'
-        if re.match(cas_pattern, identifier_str):
-            return {
-                'type': '标准CAS号',
-                'is_valid': True,
-                'formatted': identifier_str,
-                'needs_query': False,
-                'suggestion': 'CAS号格式正确，需验证准确性'
-            }
-        
-        # 流水号判断（纯数字）
-        if identifier_str.isdigit() and len(identifier_str) >= 6:
-            return {
-                'type': '本地流水号',
-                'is_valid': True,
-                'formatted': identifier_str,
-                'needs_query': True,
-                'suggestion': '检测到本地流水号，建议查询对应的国际CAS号'
-            }
-        
-        # 格式异常
-        return {
-            'type': '格式异常',
-            'is_valid': False,
-            'formatted': identifier_str,
-            'needs_query': True,
-            'suggestion': f'编号格式不标准：{identifier_str}，需要重新查询验证'
-        }
+        # 同一批数据中CAS号大量重复，分类结果按字符串缓存；返回副本避免调用方修改缓存
+        return dict(_classify_identifier(str(identifier).strip()))
 
     @staticmethod
     def extract_numbers(text: str) -> List[float]:
@@ -6,46 +6,83 @@
 """
 
 import re
+from urllib.parse import urlparse
+import numpy as np
 import pandas as pd
 from typing import Any, List, Dict, Optional, Union
 import logging
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+
+# 验证模式（模块级编译，热点校验函数直接引用其绑定方法，省去类属性查找）
+_CAS_PATTERN = re.compile(r'^\d{2,7}-\d{2}-\d$')
+_MOLECULAR_FORMULA_PATTERN = re.compile(r'^(?:[A-Z][a-z]?\d*)+$')  # 每个元素后至多一段数字，避免回溯
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_PATTERN = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+_CAS_TEXT_PATTERN = re.compile(r'\b\d{2,7}-\d{2}-\d\b')  # 文本中的CAS号
+
+_CAS_MATCH = _CAS_PATTERN.match
+_FORMULA_MATCH = _MOLECULAR_FORMULA_PATTERN.match
+_EMAIL_MATCH = _EMAIL_PATTERN.match
+_URL_MATCH = _URL_PATTERN.match
+_CAS_TEXT_FINDALL = _CAS_TEXT_PATTERN.findall
 
 
 class ValidationUtils:
     """验证工具类"""
     
     # 验证模式
-    CAS_PATTERN = re.compile(r'^\d{2,7}-\d{2}-\d$')
-    MOLECULAR_FORMULA_PATTERN = re.compile(r'^[A-Z][a-z]?(\d*[A-Z][a-z]?\d*)*$')
-    EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    CAS_PATTERN = _CAS_PATTERN
+    MOLECULAR_FORMULA_PATTERN = _MOLECULAR_FORMULA_PATTERN
+    EMAIL_PATTERN = _EMAIL_PATTERN
+    URL_PATTERN = _URL_PATTERN
+    CAS_TEXT_PATTERN = _CAS_TEXT_PATTERN
+    NON_CAS_CHAR_PATTERN = re.compile(r'[^\d-]')  # CAS号以外的字符
+    CAS_PREFIX_PATTERN = re.compile(r'^\s*cas[:\s]\s*', re.IGNORECASE)  # "CAS:"/"cas "等前缀
+    _CAS_KEEP_TABLE = {c: None for c in range(128) if chr(c) not in '0123456789-'}  # 删除ASCII中的非CAS字符
+    
+    HTTP_SCHEMES = frozenset({'http', 'https'})
+    
+    # 候选CAS号达到该数量时改用批量校验，数量少时逐个校验更快
+    BATCH_CHECKSUM_MIN = 16
+    
+    # 可识别的布尔值文本（小写）
+    BOOL_VALUES = frozenset({'true', 'false', '1', '0', 'yes', 'no', 'y', 'n'})
     
     @staticmethod
     def is_valid_cas_number(cas: Any) -> bool:
         """验证CAS号格式"""
-        if pd.isna(cas) or not isinstance(cas, str):
+        if not isinstance(cas, str):
             return False
         
-        cas = cas.strip()
-        return bool(ValidationUtils.CAS_PATTERN.match(cas))
+        return bool(_CAS_MATCH(cas.strip()))
     
-    @staticmethod
-    def is_valid_cas(cas: Any) -> bool:
-        """验证CAS号格式（简化方法名）"""
-        return ValidationUtils.is_valid_cas_number(cas)
+    # 简化方法名
+    is_valid_cas = is_valid_cas_number
     
     @staticmethod
     def is_valid_molecular_formula(formula: Any) -> bool:
         """验证分子式格式"""
-        if pd.isna(formula) or not isinstance(formula, str):
+        if not isinstance(formula, str):
             return False
         
-        formula = formula.strip()
-        return bool(ValidationUtils.MOLECULAR_FORMULA_PATTERN.match(formula))
+        return bool(_FORMULA_MATCH(formula.strip()))
     
     @staticmethod
     def is_valid_chemical_name(name: Any, min_length: int = 2, max_length: int = 100) -> bool:
         """验证化学品名称"""
-        if pd.isna(name) or not isinstance(name, str):
+        if not isinstance(name, str):
             return False
         
         name = name.strip()
@@ -83,27 +120,51 @@ class ValidationUtils:
     @staticmethod
     def is_valid_email(email: Any) -> bool:
         """验证电子邮件格式"""
-        if pd.isna(email) or not isinstance(email, str):
+        if not isinstance(email, str):
             return False
         
-        return bool(ValidationUtils.EMAIL_PATTERN.match(email.strip()))
+        return bool(_EMAIL_MATCH(email.strip()))
+    
+    @staticmethod
+    def _match_series(series: pd.Series, pattern: re.Pattern) -> pd.Series:
+        """对整列执行正则匹配，空值视为无效"""
+        return series.astype("string").str.strip().str.match(pattern.pattern, na=False).astype(bool)
+    
+    @staticmethod
+    def is_valid_cas_series(series: pd.Series) -> pd.Series:
+        """按列验证CAS号格式，返回布尔Series"""
+        return ValidationUtils._match_series(series, ValidationUtils.CAS_PATTERN)
+    
+    @staticmethod
+    def is_valid_formula_series(series: pd.Series) -> pd.Series:
+        """按列验证分子式格式，返回布尔Series"""
+        return ValidationUtils._match_series(series, ValidationUtils.MOLECULAR_FORMULA_PATTERN)
     
     @staticmethod
-    def is_valid_url(url: Any) -> bool:
-        """验证URL格式"""
-        if pd.isna(url) or not isinstance(url, str):
+    def is_valid_email_series(series: pd.Series) -> pd.Series:
+        """按列验证电子邮件格式，返回布尔Series"""
+        return ValidationUtils._match_series(series, ValidationUtils.EMAIL_PATTERN)
+    
+    @staticmethod
+    def is_valid_url(url: Any, strict: bool = False) -> bool:
+        """
+        验证URL格式
+        
+        默认按结构解析（http/https 且包含主机部分），线性时间；
+        strict=True 时额外使用正则校验域名/IP/端口格式。
+        """
+        if not isinstance(url, str):
             return False
         
         url = url.strip()
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
-        return bool(url_pattern.match(url))
+        if strict:
+            return bool(_URL_MATCH(url))
+        
+        try:
+            parsed = urlparse(url)
+        except ValueError:
+            return False
+        return parsed.scheme in ValidationUtils.HTTP_SCHEMES and bool(parsed.netloc)
     
     @staticmethod
     def validate_dataframe_schema(df: pd.DataFrame, required_columns: List[str], 
@@ -136,8 +197,19 @@ class ValidationUtils:
         return validation_result
     
     @staticmethod
-    def validate_data_types(df: pd.DataFrame, type_constraints: Dict[str, type]) -> Dict[str, Any]:
-        """验证数据类型"""
+    def _numeric_view(df: pd.DataFrame, column: str,
+                      numeric_cache: Optional[Dict[str, pd.Series]] = None) -> pd.Series:
+        """列的数值视图（无法解析的值为NaN）；提供缓存字典时同一列只转换一次"""
+        if numeric_cache is None:
+            return pd.to_numeric(df[column], errors='coerce')
+        if column not in numeric_cache:
+            numeric_cache[column] = pd.to_numeric(df[column], errors='coerce')
+        return numeric_cache[column]
+    
+    @staticmethod
+    def validate_data_types(df: pd.DataFrame, type_constraints: Dict[str, type],
+                            numeric_cache: Optional[Dict[str, pd.Series]] = None) -> Dict[str, Any]:
+        """验证数据类型（numeric_cache 用于与范围验证共享数值转换结果）"""
         validation_result = {
             'is_valid': True,
             'type_errors': {},
@@ -155,8 +227,11 @@ class ValidationUtils:
             # 检查类型兼容性
             if expected_type in [int, float]:
                 try:
-                    pd.to_numeric(series, errors='raise')
+                    numeric = ValidationUtils._numeric_view(df, column, numeric_cache)
+                    convertible = not (numeric.isna() & df[column].notna()).any()
                 except (ValueError, TypeError):
+                    convertible = False
+                if not convertible:
                     validation_result['is_valid'] = False
                     validation_result['type_errors'][column] = f"无法转换为{expected_type.__name__}"
                     validation_result['conversion_suggestions'][column] = "检查数据中的非数值内容"
@@ -166,18 +241,37 @@ class ValidationUtils:
                 pass
             
             elif expected_type == bool:
-                # 检查布尔值
-                bool_values = series.astype(str).str.lower()
-                valid_bool = bool_values.isin(['true', 'false', '1', '0', 'yes', 'no', 'y', 'n'])
-                if not valid_bool.all():
+                # 已是布尔类型的列无需逐值检查
+                if pd.api.types.is_bool_dtype(series):
+                    continue
+                
+                if not ValidationUtils._is_bool_text_series(series):
                     validation_result['is_valid'] = False
                     validation_result['type_errors'][column] = "包含无效的布尔值"
         
         return validation_result
     
     @staticmethod
-    def validate_data_range(df: pd.DataFrame, range_constraints: Dict[str, Dict[str, float]]) -> Dict[str, Any]:
-        """验证数据范围"""
+    def _is_bool_text_series(series: pd.Series) -> bool:
+        """检查（不含空值的）列是否全部为可识别的布尔值文本"""
+        # 安装了pyarrow且列为纯字符串时，用Arrow向量化计算，避免生成object字符串列
+        if pc is not None:
+            try:
+                arr = pa.array(series, type=pa.string(), from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                arr = None
+            if arr is not None:
+                valid = pc.is_in(pc.utf8_lower(arr), value_set=pa.array(sorted(ValidationUtils.BOOL_VALUES)))
+                return bool(pc.all(valid).as_py())
+        
+        # 单次遍历，不生成中间字符串列
+        bool_values = ValidationUtils.BOOL_VALUES
+        return bool(series.map(lambda x: str(x).lower() in bool_values).all())
+    
+    @staticmethod
+    def validate_data_range(df: pd.DataFrame, range_constraints: Dict[str, Dict[str, float]],
+                            numeric_cache: Optional[Dict[str, pd.Series]] = None) -> Dict[str, Any]:
+        """验证数据范围（numeric_cache 用于与类型验证共享数值转换结果）"""
         validation_result = {
             'is_valid': True,
             'range_errors': {},
@@ -188,8 +282,8 @@ class ValidationUtils:
             if column not in df.columns:
                 continue
             
-            series = pd.to_numeric(df[column], errors='coerce').dropna()
-            if len(series) == 0:
+            values = ValidationUtils._numeric_view(df, column, numeric_cache).dropna().to_numpy()
+            if len(values) == 0:
                 continue
             
             min_val = constraints.get('min')
@@ -198,14 +292,14 @@ class ValidationUtils:
             violations = []
             
             if min_val is not None:
-                below_min = series < min_val
-                if below_min.any():
-                    violations.append(f"{below_min.sum()} 个值小于最小值 {min_val}")
+                below_min = np.count_nonzero(values < min_val)
+                if below_min:
+                    violations.append(f"{below_min} 个值小于最小值 {min_val}")
             
             if max_val is not None:
-                above_max = series > max_val
-                if above_max.any():
-                    violations.append(f"{above_max.sum()} 个值大于最大值 {max_val}")
+                above_max = np.count_nonzero(values > max_val)
+                if above_max:
+                    violations.append(f"{above_max} 个值大于最大值 {max_val}")
             
             if violations:
                 validation_result['is_valid'] = False
@@ -227,15 +321,16 @@ class ValidationUtils:
             if column not in df.columns:
                 continue
             
-            series = df[column].dropna()
-            duplicates = series.duplicated()
+            # 一次哈希计数同时得到重复数量和重复值
+            value_counts = df[column].value_counts(dropna=True, sort=False)
+            repeated = value_counts[value_counts > 1]
             
-            if duplicates.any():
+            if not repeated.empty:
                 validation_result['is_valid'] = False
-                duplicate_count = duplicates.sum()
+                duplicate_count = int((repeated - 1).sum())
                 validation_result['duplicate_errors'][column] = {
                     'count': duplicate_count,
-                    'duplicate_values': series[duplicates].unique().tolist()[:10]  # 只显示前10个
+                    'duplicate_values': repeated.index[:10].tolist()  # 只显示前10个
                 }
                 validation_result['total_duplicates'] += duplicate_count
         
@@ -265,10 +360,20 @@ class ValidationUtils:
             if not schema_result['is_valid']:
                 result['overall_valid'] = False
                 result['summary']['total_errors'] += 1
+            
+            # 缺少必需列时数据已不可用，跳过后续逐列扫描
+            if schema_result['missing_required']:
+                result['summary']['skipped'] = [
+                    name for name in ('types', 'ranges', 'unique') if name in validation_config
+                ]
+                return result
+        
+        # 类型与范围验证共享各列的数值转换结果
+        numeric_cache: Dict[str, pd.Series] = {}
         
         # 类型验证
         if 'types' in validation_config:
-            type_result = ValidationUtils.validate_data_types(df, validation_config['types'])
+            type_result = ValidationUtils.validate_data_types(df, validation_config['types'], numeric_cache)
             result['validations']['types'] = type_result
             if not type_result['is_valid']:
                 result['overall_valid'] = False
@@ -276,7 +381,7 @@ class ValidationUtils:
         
         # 范围验证
         if 'ranges' in validation_config:
-            range_result = ValidationUtils.validate_data_range(df, validation_config['ranges'])
+            range_result = ValidationUtils.validate_data_range(df, validation_config['ranges'], numeric_cache)
             result['validations']['ranges'] = range_result
             if not range_result['is_valid']:
                 result['overall_valid'] = False
@@ -314,14 +419,15 @@ class ValidationUtils:
         cas_str = str(cas).strip()
         
         # 移除可能的前后缀
-        cas_str = cas_str.replace("CAS:", "").replace("CAS ", "").replace("cas:", "").replace("cas ", "")
-        cas_str = cas_str.strip()
+        cas_str = ValidationUtils.CAS_PREFIX_PATTERN.sub('', cas_str, count=1).strip()
         
         # 基本格式检查
-        if not ValidationUtils.CAS_PATTERN.match(cas_str):
+        if not _CAS_MATCH(cas_str):
             # 尝试修复常见的格式问题
             # 移除多余的空格和特殊字符
-            cas_clean = re.sub(r'[^\d-]', '', cas_str)
+            cas_clean = cas_str.translate(ValidationUtils._CAS_KEEP_TABLE)
+            if not cas_clean.isascii():
+                cas_clean = ValidationUtils.NON_CAS_CHAR_PATTERN.sub('', cas_clean)
             
             # 检查是否是纯数字，尝试添加分隔符
             if cas_clean.isdigit() and len(cas_clean) >= 5:
@@ -333,7 +439,7 @@ class ValidationUtils:
                     cas_clean = f"{cas_clean[:-3]}-{cas_clean[-3:-1]}-{cas_clean[-1]}"
             
             # 再次验证修复后的格式
-            if ValidationUtils.CAS_PATTERN.match(cas_clean):
+            if _CAS_MATCH(cas_clean):
                 return True, cas_clean, "格式已修复"
             else:
                 return False, cas_str, f"CAS号格式不正确: {cas_str}"
@@ -363,14 +469,8 @@ class ValidationUtils:
             # 校验位是最后一位
             check_digit = int(digits[-1])
             
-            # 计算校验和
-            checksum = 0
-            weight = 1
-            
-            # 从倒数第二位开始，向前计算
-            for i in range(len(digits) - 2, -1, -1):
-                checksum += int(digits[i]) * weight
-                weight += 1
+            # 从倒数第二位开始向前，权重依次为1, 2, 3...
+            checksum = sum(weight * int(d) for weight, d in enumerate(digits[-2::-1], 1))
             
             # 校验和模10应等于校验位
             return (checksum % 10) == check_digit
@@ -378,6 +478,41 @@ class ValidationUtils:
         except (ValueError, IndexError):
             return False
     
+    @staticmethod
+    def _validate_cas_checksum_array(cas_arr: Union[np.ndarray, List[str]]) -> np.ndarray:
+        """
+        批量验证CAS号的校验位
+        
+        将所有CAS号左侧补零为定宽数字矩阵，一次矩阵乘法算出全部校验和。
+        
+        Args:
+            cas_arr: CAS号字符串数组
+            
+        Returns:
+            与输入等长的布尔数组
+        """
+        digits = [str(cas).replace('-', '') for cas in cas_arr]
+        well_formed = np.fromiter((d.isdecimal() for d in digits), dtype=bool, count=len(digits))
+        if not well_formed.any():
+            return well_formed
+        
+        # 非ASCII数字（如全角）先转成ASCII；左侧补零不影响校验和
+        digits = [str(int(d)) if ok and not d.isascii() else d for d, ok in zip(digits, well_formed)]
+        
+        width = max(len(d) for d, ok in zip(digits, well_formed) if ok)
+        
+        # 格式不合法的条目用全零占位，结果由 well_formed 屏蔽
+        buffer = b''.join(
+            d.rjust(width, '0').encode('ascii') if ok else b'0' * width
+            for d, ok in zip(digits, well_formed)
+        )
+        matrix = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, width).astype(np.int64) - ord('0')
+        
+        # 从倒数第二位开始向前，权重依次为1, 2, 3...
+        weights = np.arange(width - 1, 0, -1, dtype=np.int64)
+        checksum = matrix[:, :-1] @ weights
+        return well_formed & (checksum % 10 == matrix[:, -1])
+    
     @staticmethod
     def extract_cas_numbers_from_text(text: str) -> List[str]:
         """
@@ -393,13 +528,40 @@ class ValidationUtils:
             return []
         
         # 使用正则表达式查找所有CAS号模式
-        cas_pattern = r'\b\d{2,7}-\d{2}-\d\b'
-        potential_cas = re.findall(cas_pattern, text)
+        potential_cas = _CAS_TEXT_FINDALL(text)
+        
+        if not potential_cas:
+            return []
+        
+        # 候选较多时（如SDS、产品目录）一次性批量校验
+        if len(potential_cas) >= ValidationUtils.BATCH_CHECKSUM_MIN:
+            valid_mask = ValidationUtils._validate_cas_checksum_array(potential_cas)
+            return [cas for cas, valid in zip(potential_cas, valid_mask) if valid]
         
         # 验证每个找到的CAS号
-        valid_cas = []
-        for cas in potential_cas:
-            if ValidationUtils._validate_cas_checksum(cas):
-                valid_cas.append(cas)
+        return [cas for cas in potential_cas if ValidationUtils._validate_cas_checksum(cas)]
+    
+    @staticmethod
+    def extract_cas_numbers_from_series(series: pd.Series) -> pd.Series:
+        """
+        按列提取文本中的CAS号
+        
+        整列一次性查找候选CAS号并批量校验，适合扫描大量文本；
+        单个文本仍使用 extract_cas_numbers_from_text。
+        
+        Args:
+            series: 待搜索的文本列
+            
+        Returns:
+            与输入同索引的Series，每个元素为找到的CAS号列表
+        """
+        hits = series.astype("string").str.findall(ValidationUtils.CAS_TEXT_PATTERN.pattern)
+        
+        # 按位置展开所有候选，避免重复索引影响分组
+        candidates = hits.reset_index(drop=True).explode().dropna()
+        found: Dict[int, List[str]] = {}
+        if not candidates.empty:
+            valid = candidates[ValidationUtils._validate_cas_checksum_array(candidates.to_numpy())]
+            found = valid.groupby(level=0).agg(list).to_dict()
         
-        return valid_cas
+        return pd.Series([found.get(i, []) for i in range(len(series))], index=series.index, dtype=object)
@@ -3,16 +3,97 @@
 用于将复杂的复合属性拆分为更精确的子属性
 """
 
+import functools
 import re
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Mapping, Tuple, Union
+from ..common_utils import CachedStateMixin, run_chunked
 from .text_normalizer import TextNormalizer
 
 
-class AttributeSplitter:
+def _keyword_pattern(keywords: List[str]) -> re.Pattern:
+    """将关键词列表编译为单个正则，一次扫描即可判断是否包含任一关键词"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+def _keyword_scan_pattern(keywords: List[str]) -> re.Pattern:
+    """编译为零宽前瞻正则，finditer 可一次扫描找出所有（包括相互重叠的）关键词"""
+    return re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+
+
+def _first_listed_keyword(pattern: re.Pattern, priority: Dict[str, int], text: str) -> Optional[str]:
+    """返回 text 中出现的关键词里在列表中排位最靠前的一个，没有则返回 None"""
+    found = {match.group(1) for match in pattern.finditer(text)}
+    return min(found, key=priority.__getitem__) if found else None
+
+
+class AttributeSplitter(CachedStateMixin):
+    # process_row 读取的所有列，逐行处理时只取这些列
+    ROW_FIELDS = [
+        '品名', 'CAS号', '外观与性状', '室温状态', '别名',
+        '熔点/凝固点', '沸点/沸程', '闪点', '自燃温度', '密度/相对密度',
+        '饱和蒸气压', '爆炸极限（LEL/UEL）', '建议存储条件', '溶解性',
+        '物理危害', '健康危害', '环境危害'
+    ]
+
+    # 物理性质：(原始列名, 属性名, TextNormalizer 提取方法名)
+    PHYSICAL_PROPERTY_FIELDS = [
+        ('熔点/凝固点', '熔点', 'extract_temperature'),
+        ('沸点/沸程', '沸点', 'extract_temperature'),
+        ('闪点', '闪点', 'extract_temperature'),
+        ('自燃温度', '自燃温度', 'extract_temperature'),
+        ('密度/相对密度', '密度', 'extract_density'),
+        ('饱和蒸气压', '饱和蒸气压', 'extract_pressure'),
+        ('爆炸极限（LEL/UEL）', '爆炸极限', 'extract_explosion_limits'),
+    ]
+
+    # 常见溶剂和溶解性关键词（按优先级排列）
+    SOLVENT_KEYWORDS = ['水', '乙醇', '乙醚', '苯', '氯仿', '丙酮', '酸', '碱']
+    SOLUBILITY_KEYWORDS = ['溶于', '不溶于', '微溶于', '易溶于', '难溶于', '混溶', '任意比例混溶']
+    _SOLVENT_SCAN = _keyword_scan_pattern(SOLVENT_KEYWORDS)
+    _SOLVENT_PRIORITY = {keyword: i for i, keyword in enumerate(SOLVENT_KEYWORDS)}
+    _SOLUBILITY_SCAN = _keyword_scan_pattern(SOLUBILITY_KEYWORDS)
+    _SOLUBILITY_PRIORITY = {keyword: i for i, keyword in enumerate(SOLUBILITY_KEYWORDS)}
+
+    # 存储条件分类关键词，按优先级排列，命中第一个即归类
+    STORAGE_CATEGORY_PATTERNS = [
+        ('温度条件', _keyword_pattern(['温度', '°C', '℃', '低温', '冷藏'])),
+        ('环境条件', _keyword_pattern(['通风', '干燥', '避光', '阴凉'])),
+        ('容器要求', _keyword_pattern(['密闭', '容器', '储存'])),
+        ('隔离要求', _keyword_pattern(['远离', '避免', '禁止', '分开'])),
+    ]
+
+    # 规范化/提取结果缓存的最大条目数（SDS数据中品名、CAS号等取值大量重复）
+    CACHE_SIZE = 65536
+    _TRANSIENT_ATTRS = ('_extractors_cached',)
+
     def __init__(self, normalizer: TextNormalizer):
         """初始化属性切分器"""
         self.normalizer = normalizer
+        self._init_caches()
+    
+    def _init_caches(self):
+        """按原始字符串缓存物理性质提取方法的结果（normalize_text 由 normalizer 自行缓存）"""
+        cache = functools.lru_cache(maxsize=self.CACHE_SIZE)
+        self._extractors_cached = {
+            method: cache(getattr(self.normalizer, method))
+            for method in {method for _, _, method in self.PHYSICAL_PROPERTY_FIELDS}
+        }
+    
+    def clear_caches(self):
+        """清空缓存（修改 normalizer 配置后需调用）"""
+        self._init_caches()
+    
+    def _extract(self, method: str, text: str) -> List[Dict[str, Any]]:
+        """
+        调用缓存的提取方法，返回结果的副本（避免不同行共享同一个可变对象）。
+        返回单个字典的提取方法（如爆炸极限）包装为单元素列表，使所有物理性质都是字典列表。
+        """
+        values = self._extractors_cached[method](text)
+        if isinstance(values, dict):
+            return [dict(values)] if values else []
+        return [dict(item) for item in values]
     
     def split_aliases(self, alias_text: str) -> List[str]:
         """分割别名"""
@@ -43,14 +124,10 @@ class AttributeSplitter:
                 continue
             
             # 根据关键词分类
-            if any(keyword in part for keyword in ['温度', '°C', '℃', '低温', '冷藏']):
-                conditions['温度条件'].append(part)
-            elif any(keyword in part for keyword in ['通风', '干燥', '避光', '阴凉']):
-                conditions['环境条件'].append(part)
-            elif any(keyword in part for keyword in ['密闭', '容器', '储存']):
-                conditions['容器要求'].append(part)
-            elif any(keyword in part for keyword in ['远离', '避免', '禁止', '分开']):
-                conditions['隔离要求'].append(part)
+            for category, pattern in self.STORAGE_CATEGORY_PATTERNS:
+                if pattern.search(part):
+                    conditions[category].append(part)
+                    break
             else:
                 conditions['其他要求'].append(part)
         
@@ -78,27 +155,17 @@ class AttributeSplitter:
         # 使用分句来分割复杂的描述
         sentences = self.normalizer.split_list_string(solubility_text, [',', '，', ';', '；', '。'])
         
-        # 常见溶剂和溶解性关键词
-        solvent_keywords = ['水', '乙醇', '乙醚', '苯', '氯仿', '丙酮', '酸', '碱']
-        solubility_keywords = ['溶于', '不溶于', '微溶于', '易溶于', '难溶于', '混溶', '任意比例混溶']
-
         for sentence in sentences:
             # 避免重复处理已提取的定量部分
             if any(char.isdigit() for char in sentence) and ('g/mL' in sentence or 'g/L' in sentence):
                 continue
 
-            found_solvent = None
-            for solvent in solvent_keywords:
-                if solvent in sentence:
-                    found_solvent = solvent
-                    break
+            found_solvent = _first_listed_keyword(self._SOLVENT_SCAN, self._SOLVENT_PRIORITY, sentence)
             
             if found_solvent:
-                found_solubility = '未知'
-                for solubility in solubility_keywords:
-                    if solubility in sentence:
-                        found_solubility = solubility
-                        break
+                found_solubility = _first_listed_keyword(
+                    self._SOLUBILITY_SCAN, self._SOLUBILITY_PRIORITY, sentence
+                ) or '未知'
                 
                 # 避免覆盖更具体的信息
                 if found_solvent not in solubility_data['qualitative']:
@@ -106,52 +173,40 @@ class AttributeSplitter:
 
         return solubility_data
 
-    def extract_physical_properties(self, row: pd.Series) -> Dict[str, Any]:
+    def extract_physical_properties(self, row: Mapping[str, Any]) -> Dict[str, Any]:
         """提取物理性质"""
         properties = {}
         
-        # 提取温度相关属性
-        if '熔点/凝固点' in row and pd.notna(row['熔点/凝固点']):
-            temps = self.normalizer.extract_temperature(str(row['熔点/凝固点']))
-            if temps:
-                properties['熔点'] = temps
-        
-        if '沸点/沸程' in row and pd.notna(row['沸点/沸程']):
-            temps = self.normalizer.extract_temperature(str(row['沸点/沸程']))
-            if temps:
-                properties['沸点'] = temps
-        
-        if '闪点' in row and pd.notna(row['闪点']):
-            temps = self.normalizer.extract_temperature(str(row['闪点']))
-            if temps:
-                properties['闪点'] = temps
-        
-        if '自燃温度' in row and pd.notna(row['自燃温度']):
-            temps = self.normalizer.extract_temperature(str(row['自燃温度']))
-            if temps:
-                properties['自燃温度'] = temps
-        
-        # 提取密度
-        if '密度/相对密度' in row and pd.notna(row['密度/相对密度']):
-            densities = self.normalizer.extract_density(str(row['密度/相对密度']))
-            if densities:
-                properties['密度'] = densities
-        
-        # 提取压力相关属性
-        if '饱和蒸气压' in row and pd.notna(row['饱和蒸气压']):
-            pressures = self.normalizer.extract_pressure(str(row['饱和蒸气压']))
-            if pressures:
-                properties['饱和蒸气压'] = pressures
-        
-        # 提取爆炸极限
-        if '爆炸极限（LEL/UEL）' in row and pd.notna(row['爆炸极限（LEL/UEL）']):
-            limits = self.normalizer.extract_explosion_limits(str(row['爆炸极限（LEL/UEL）']))
-            if limits:
-                properties['爆炸极限'] = limits
+        for column, prop_name, method in self.PHYSICAL_PROPERTY_FIELDS:
+            if column in row and pd.notna(row[column]):
+                values = self._extract(method, str(row[column]))
+                if values:
+                    properties[prop_name] = values
+        
+        return properties
+    
+    def extract_physical_properties_frame(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        按列提取整个DataFrame的物理性质，结果与逐行调用 extract_physical_properties 相同。
+        每列只对非空值调用一次提取方法，避免逐行逐列分派。
+        """
+        properties = [{} for _ in range(len(df))]
+        
+        for column, prop_name, method in self.PHYSICAL_PROPERTY_FIELDS:
+            if column not in df.columns:
+                continue
+            
+            series = df[column]
+            mask = series.notna().to_numpy()
+            extractor = functools.partial(self._extract, method)
+            extracted = series[mask].astype(str).map(extractor)
+            for pos, values in zip(np.flatnonzero(mask), extracted):
+                if values:
+                    properties[pos][prop_name] = values
         
         return properties
     
-    def extract_hazard_info(self, row: pd.Series) -> Dict[str, Any]:
+    def extract_hazard_info(self, row: Mapping[str, Any]) -> Dict[str, Any]:
         """提取危害信息"""
         hazards = {}
         
@@ -175,8 +230,16 @@ class AttributeSplitter:
         
         return hazards
     
-    def process_row(self, row: pd.Series) -> Dict[str, Any]:
-        """处理单行数据"""
+    def process_row(self, row: Mapping[str, Any],
+                    physical_properties: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        处理单行数据（row 可以是 pd.Series 或 列名->值 的字典）
+        
+        physical_properties 为按列预先提取的物理性质，未提供时从 row 中提取。
+        
+        结果结构约定：physical_properties 的每个值都是字典列表；
+        hazards 中 '健康危害' 为 分类->描述列表 的字典，其余危害类别为字符串列表。
+        """
         processed = {
             'basic_info': {},
             'aliases': [],
@@ -199,7 +262,9 @@ class AttributeSplitter:
             processed['aliases'] = self.split_aliases(str(row['别名']))
         
         # 处理物理性质
-        processed['physical_properties'] = self.extract_physical_properties(row)
+        if physical_properties is None:
+            physical_properties = self.extract_physical_properties(row)
+        processed['physical_properties'] = physical_properties
         
         # 处理存储条件
         if '建议存储条件' in row and pd.notna(row['建议存储条件']):
@@ -214,12 +279,40 @@ class AttributeSplitter:
         
         return processed
     
-    def split_compound_fields(self, df: pd.DataFrame) -> pd.DataFrame:
-        """分割复合字段"""
-        processed_data = []
+    def _process_chunk(self, df: pd.DataFrame) -> List[Tuple[Any, Optional[Dict[str, Any]], Optional[Exception]]]:
+        """顺序处理一块数据，返回每行的 (行号, 处理结果, 错误信息)，出错的行处理结果为 None，不影响其他行"""
+        # 物理性质按列一次提取；按列提取出错时改为逐行提取，错误只记在出错的行上
+        try:
+            physical = self.extract_physical_properties_frame(df)
+        except Exception:
+            physical = [None] * len(df)
         
-        for _, row in df.iterrows():
-            processed_row = self.process_row(row)
-            processed_data.append(processed_row)
+        # 其余字段只取需要的列并按元组迭代，避免 iterrows 为每行构造 Series
+        columns = [col for col in self.ROW_FIELDS if col in df.columns]
+        results = []
+        for idx, values, properties in zip(df.index, df[columns].itertuples(index=False, name=None), physical):
+            try:
+                results.append((idx, self.process_row(dict(zip(columns, values)), properties), None))
+            except Exception as e:
+                results.append((idx, None, e))
+        return results
+    
+    def split_compound_fields(self, df: pd.DataFrame, n_jobs: int = 1,
+                              as_dataframe: bool = True) -> Union[pd.DataFrame, List[Dict[str, Any]]]:
+        """
+        分割复合字段
         
-        return pd.DataFrame(processed_data)
+        结果为嵌套字典，只需遍历或序列化时传入 as_dataframe=False 直接取得记录列表，
+        省去构建 object 类型 DataFrame 的开销。
+        
+        Args:
+            df: 原始数据
+            n_jobs: 并行进程数，1 为单进程，-1 使用全部CPU核心
+            as_dataframe: 为 True 时返回 DataFrame，否则返回每行处理结果组成的列表
+        """
+        records = []
+        for _, record, error in run_chunked(self._process_chunk, df, n_jobs):
+            if error is not None:
+                raise error
+            records.append(record)
+        return pd.DataFrame(records) if as_dataframe else records
@@ -7,29 +7,80 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional
 import os
-import json
+import csv
+import codecs
+from ..common_utils import run_chunked, write_json
 from .text_normalizer import TextNormalizer
 from .attribute_splitter import AttributeSplitter
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
 
 
 class DataProcessor:
-    def __init__(self, config_path: Optional[str] = None):
-        """初始化数据处理器"""
+    # 不重复品名超过该数量时，相似品名检测改用分块近似匹配，避免 N² 次比较
+    BLOCKED_SIMILARITY_MIN_NAMES = 5000
+    # CSV 候选编码（按优先级）及编码探测读取的字节数
+    CSV_ENCODINGS = ['utf-8', 'utf-8-sig', 'gb18030', 'gbk']
+    ENCODING_SAMPLE_BYTES = 65536
+    # 清洗时视为缺失的无效值
+    INVALID_VALUES = ['N/A', '处理异常', '', 'null', 'NULL']
+
+    def __init__(self, config_path: Optional[str] = None, n_jobs: int = 1):
+        """
+        初始化数据处理器
+        
+        Args:
+            config_path: 配置文件路径
+            n_jobs: 处理属性时的并行进程数，1 为单进程，-1 使用全部CPU核心
+        """
         self.config_path = config_path
+        self.n_jobs = n_jobs
         self.normalizer = TextNormalizer(config_path)
         self.splitter = AttributeSplitter(self.normalizer)
         self.processed_data = None
         self.original_data = None
     
+    def _sniff_csv_encodings(self, file_path: str) -> List[str]:
+        """
+        根据文件开头的字节样本排列候选编码：带 BOM 的直接用 utf-8-sig，
+        否则能解码样本的编码排在前面，其余保持原优先级作为后备。
+        """
+        with open(file_path, 'rb') as f:
+            sample = f.read(self.ENCODING_SAMPLE_BYTES)
+        
+        if sample.startswith(codecs.BOM_UTF8):
+            return ['utf-8-sig'] + [enc for enc in self.CSV_ENCODINGS if enc != 'utf-8-sig']
+        
+        decodable = []
+        for encoding in self.CSV_ENCODINGS:
+            try:
+                # 增量解码允许样本末尾截断半个多字节字符
+                codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+                decodable.append(encoding)
+            except UnicodeDecodeError:
+                continue
+        return decodable + [enc for enc in self.CSV_ENCODINGS if enc not in decodable]
+    
+    def _read_csv(self, file_path: str, encoding: str) -> pd.DataFrame:
+        """读取CSV；安装 pyarrow 时使用其多线程解析器，解析失败再退回 pandas 默认引擎"""
+        if pyarrow is not None:
+            try:
+                return pd.read_csv(file_path, encoding=encoding, engine='pyarrow')
+            except (pyarrow.ArrowException, pd.errors.ParserError):
+                pass
+        return pd.read_csv(file_path, encoding=encoding)
+    
     def load_data(self, file_path: str) -> pd.DataFrame:
-        """加载数据文件，尝试多种编码格式"""
+        """加载数据文件，先探测编码，通常只需完整解析一次"""
         try:
             if file_path.endswith('.csv'):
-                encodings_to_try = ['utf-8', 'utf-8-sig', 'gb18030', 'gbk']
+                encodings_to_try = self._sniff_csv_encodings(file_path)
                 df = None
                 for encoding in encodings_to_try:
                     try:
-                        df = pd.read_csv(file_path, encoding=encoding)
+                        df = self._read_csv(file_path, encoding)
                         print(f"成功使用 '{encoding}' 编码加载文件。")
                         break
                     except UnicodeDecodeError:
@@ -38,6 +89,10 @@ class DataProcessor:
                     raise ValueError(f"无法使用支持的编码格式 {encodings_to_try} 解码文件。")
             elif file_path.endswith(('.xlsx', '.xls')):
                 df = pd.read_excel(file_path)
+            elif file_path.endswith('.feather'):
+                df = pd.read_feather(file_path)
+            elif file_path.endswith('.parquet'):
+                df = pd.read_parquet(file_path)
             else:
                 raise ValueError(f"不支持的文件格式: {file_path}")
             
@@ -57,13 +112,15 @@ class DataProcessor:
         df = df.dropna(how='all')
         
         # 处理无效值
-        invalid_values = ['N/A', '处理异常', '', 'null', 'NULL']
-        df = df.replace(invalid_values, np.nan)
+        # isin 对整表做一次哈希查找，mask 将命中的单元格置为 NaN
+        df = df.mask(df.isin(self.INVALID_VALUES))
         
-        # 标准化文本
+        # 标准化文本：每列只对不重复的非空值调用一次 normalize_text，再整体映射
         text_columns = df.select_dtypes(include=['object']).columns
         for col in text_columns:
-            df[col] = df[col].apply(lambda x: self.normalizer.normalize_text(str(x)) if pd.notna(x) else x)
+            values = df[col]
+            mapping = {value: self.normalizer.normalize_text(str(value)) for value in values.dropna().unique()}
+            df[col] = values.map(mapping)
         
         print(f"清洗后数据: {len(df)} 行")
         return df
@@ -78,20 +135,21 @@ class DataProcessor:
         full_duplicates = df.duplicated().sum()
         duplicates_info['完全重复行数'] = full_duplicates
         
-        # 检测基于品名的重复
+        # 检测基于品名、CAS号的重复：重复行数 = 行数 - 不同取值数（缺失值算作一个取值，与 duplicated 一致），
+        # 只需对单列做一次去重计数，不必为每行生成重复标记
         if '品名' in df.columns:
-            name_duplicates = df.duplicated(subset=['品名']).sum()
-            duplicates_info['品名重复行数'] = name_duplicates
+            duplicates_info['品名重复行数'] = len(df) - df['品名'].nunique(dropna=False)
         
-        # 检测基于CAS号的重复
         if 'CAS号' in df.columns:
-            cas_duplicates = df.duplicated(subset=['CAS号']).sum()
-            duplicates_info['CAS号重复行数'] = cas_duplicates
+            duplicates_info['CAS号重复行数'] = len(df) - df['CAS号'].nunique(dropna=False)
         
         # 使用模糊匹配检测相似品名
         if '品名' in df.columns:
             chemical_names = df['品名'].dropna().unique().tolist()
-            similar_groups = self.find_similar_chemicals(chemical_names)
+            if len(chemical_names) > self.BLOCKED_SIMILARITY_MIN_NAMES:
+                similar_groups = self.find_similar_chemicals_blocked(chemical_names)
+            else:
+                similar_groups = self.find_similar_chemicals(chemical_names)
             duplicates_info['相似品名组数'] = len(similar_groups)
             duplicates_info['相似品名详情'] = similar_groups
         
@@ -99,19 +157,11 @@ class DataProcessor:
     
     def find_similar_chemicals(self, names: List[str], threshold: int = 85) -> List[List[str]]:
         """查找相似的化学品名称"""
-        similar_groups = []
-        processed = set()
-        
-        for name in names:
-            if name in processed:
-                continue
-            
-            similar = self.normalizer.find_similar_terms(name, names, threshold)
-            if len(similar) > 1:
-                similar_groups.append(similar)
-                processed.update(similar)
-        
-        return similar_groups
+        return self.normalizer.find_similar_groups(names, threshold)
+    
+    def find_similar_chemicals_blocked(self, names: List[str], threshold: int = 85) -> List[List[str]]:
+        """查找相似的化学品名称（n-gram 分块近似匹配，适合大量名称）"""
+        return self.normalizer.find_similar_groups_blocked(names, threshold)
     
     def standardize_chemicals(self, df: pd.DataFrame) -> pd.DataFrame:
         """标准化化学品名称"""
@@ -122,14 +172,17 @@ class DataProcessor:
         
         # 获取所有化学品名称
         all_names = []
-        for _, row in df.iterrows():
+        # 直接按列取值，避免 iterrows 为每行构造 Series
+        names = df['品名'].to_numpy()
+        aliases_column = df['别名'].to_numpy() if '别名' in df.columns else [None] * len(df)
+        for name, alias in zip(names, aliases_column):
             # 确保品名是字符串
-            if pd.notna(row['品名']):
-                all_names.append(str(row['品名']))
+            if pd.notna(name):
+                all_names.append(str(name))
 
-            if '别名' in row and pd.notna(row['别名']):
+            if pd.notna(alias):
                 # 确保别名是字符串
-                aliases = self.splitter.split_aliases(str(row['别名']))
+                aliases = self.splitter.split_aliases(str(alias))
                 all_names.extend(aliases)
         
         # 标准化名称映射
@@ -139,28 +192,34 @@ class DataProcessor:
         
         # 应用标准化
         df_copy = df.copy()
-        # 在替换前，确保'品名'列是字符串类型
-        df_copy['品名'] = df_copy['品名'].astype(str)
-        for old_name, new_name in name_mapping.items():
-            df_copy['品名'] = df_copy['品名'].replace(old_name, new_name)
+        # 在替换前，确保'品名'列是字符串类型；逐值查一次字典，不在映射中的保持原值
+        # （Series.replace 会为映射中的每个键各扫描一遍列）
+        names = df_copy['品名'].astype(str)
+        df_copy['品名'] = pd.Series([name_mapping.get(name, name) for name in names], index=names.index, dtype=names.dtype)
         
         print(f"标准化了 {len(name_mapping)} 个化学品名称")
         return df_copy
     
-    def process_attributes(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
-        """处理所有属性"""
+    def process_attributes(self, df: pd.DataFrame, n_jobs: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        处理所有属性
+        
+        各行相互独立，n_jobs 大于 1 时按块分给多个进程处理，结果按原行顺序合并；
+        未指定 n_jobs 时使用初始化时的设置。
+        """
         print("处理复合属性...")
         
-        processed_records = []
+        n_jobs = self.n_jobs if n_jobs is None else n_jobs
+        # 物理性质由 AttributeSplitter 按列批量提取，出错的行单独记录，不影响其他行
+        results = run_chunked(self.splitter._process_chunk, df, n_jobs)
         
-        for idx, row in df.iterrows():
-            try:
-                processed_row = self.splitter.process_row(row)
-                processed_row['原始行号'] = idx
-                processed_records.append(processed_row)
-            except Exception as e:
-                print(f"处理第 {idx} 行时出错: {e}")
+        processed_records = []
+        for idx, processed_row, error in results:
+            if error is not None:
+                print(f"处理第 {idx} 行时出错: {error}")
                 continue
+            processed_row['原始行号'] = idx
+            processed_records.append(processed_row)
         
         print(f"成功处理 {len(processed_records)} 条记录")
         return processed_records
@@ -204,81 +263,82 @@ class DataProcessor:
         
         # 保存完整的处理结果
         output_file = os.path.join(output_dir, 'processed_chemicals.json')
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(processed_data, f, ensure_ascii=False, indent=2)
+        write_json(processed_data, output_file)
         
         # 生成扁平化的CSV文件
-        flattened_data = self.flatten_processed_data(processed_data)
         csv_file = os.path.join(output_dir, 'processed_chemicals.csv')
-        flattened_df = pd.DataFrame(flattened_data)
-        flattened_df.to_csv(csv_file, index=False, encoding='utf-8-sig')
+        self.save_flattened_csv(processed_data, csv_file)
         
         # 保存统计信息
         stats = self.generate_statistics(processed_data)
         stats_file = os.path.join(output_dir, 'processing_statistics.json')
-        with open(stats_file, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, ensure_ascii=False, indent=2)
+        write_json(stats, stats_file)
         
         print(f"处理结果已保存到: {output_dir}")
         return output_file, csv_file, stats_file
     
+    def save_flattened_csv(self, processed_data: List[Dict[str, Any]], csv_file: str):
+        """
+        流式写出扁平化的CSV：第一遍只收集列名（按首次出现顺序），第二遍逐条扁平化并写入，
+        不在内存中同时保留全部扁平化记录和对应的 DataFrame。
+        """
+        fieldnames = list(dict.fromkeys(
+            key for record in processed_data for key in self.flatten_record(record)
+        ))
+        with open(csv_file, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.DictWriter(f, fieldnames, lineterminator=os.linesep)
+            writer.writeheader()
+            for record in processed_data:
+                writer.writerow(self.flatten_record(record))
+    
+    def flatten_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """扁平化单条处理结果"""
+        base_record = record.get('basic_info', {}).copy()
+        base_record['原始行号'] = record.get('原始行号')
+        
+        # 添加别名（合并为字符串）
+        if record.get('aliases'):
+            base_record['别名_处理后'] = '; '.join(record['aliases'])
+        
+        # 添加物理性质（每个属性都是字典列表，见 AttributeSplitter.process_row）
+        for prop_name, prop_values in record.get('physical_properties', {}).items():
+            for i, prop_data in enumerate(prop_values):
+                prefix = f'{prop_name}_{i+1}'
+                for key, value in prop_data.items():
+                    base_record[f'{prefix}_{key}'] = value
+        
+        # 添加存储条件
+        for condition_type, conditions in record.get('storage_conditions', {}).items():
+            base_record[f'存储_{condition_type}'] = '; '.join(conditions)
+        
+        # 添加溶解性
+        solubility_info = record.get('solubility', {})
+        # 定性溶解性
+        qual_sol = solubility_info.get('qualitative', {})
+        if qual_sol:
+            qual_str = '; '.join([f"{solvent}: {desc}" for solvent, desc in qual_sol.items()])
+            base_record['溶解性_定性'] = qual_str
+        
+        # 定量溶解性
+        quant_sol_list = solubility_info.get('quantitative', [])
+        for i, quant_data in enumerate(quant_sol_list):
+            prefix = f'溶解性_定量_{i+1}'
+            for key, value in quant_data.items():
+                base_record[f'{prefix}_{key}'] = value
+        
+        # 添加危害信息（每个类别要么是字符串列表，要么是 分类->列表 的字典）
+        for hazard_type, hazards in record.get('hazards', {}).items():
+            if type(hazards) is dict:
+                for sub_type, sub_hazards in hazards.items():
+                    base_record[f'危害_{hazard_type}_{sub_type}'] = '; '.join(sub_hazards)
+            else:
+                base_record[f'危害_{hazard_type}'] = '; '.join(hazards)
+        
+        return base_record
+    
     def flatten_processed_data(self, processed_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """扁平化处理后的数据，以适应新的详细结构"""
-        flattened = []
-        
-        for record in processed_data:
-            base_record = record.get('basic_info', {}).copy()
-            base_record['原始行号'] = record.get('原始行号')
-            
-            # 添加别名（合并为字符串）
-            if record.get('aliases'):
-                base_record['别名_处理后'] = '; '.join(record['aliases'])
-            
-            # 添加物理性质
-            for prop_name, prop_values in record.get('physical_properties', {}).items():
-                if isinstance(prop_values, list):
-                    # 处理字典列表，例如温度、压力等
-                    for i, prop_data in enumerate(prop_values):
-                        prefix = f'{prop_name}_{i+1}'
-                        if isinstance(prop_data, dict):
-                            for key, value in prop_data.items():
-                                base_record[f'{prefix}_{key}'] = value
-                elif isinstance(prop_values, dict):
-                    # 处理单个字典，例如爆炸极限
-                    for key, value in prop_values.items():
-                        base_record[f'{prop_name}_{key}'] = value
-            
-            # 添加存储条件
-            for condition_type, conditions in record.get('storage_conditions', {}).items():
-                base_record[f'存储_{condition_type}'] = '; '.join(conditions)
-            
-            # 添加溶解性
-            solubility_info = record.get('solubility', {})
-            # 定性溶解性
-            qual_sol = solubility_info.get('qualitative', {})
-            if qual_sol:
-                qual_str = '; '.join([f"{solvent}: {desc}" for solvent, desc in qual_sol.items()])
-                base_record['溶解性_定性'] = qual_str
-            
-            # 定量溶解性
-            quant_sol_list = solubility_info.get('quantitative', [])
-            for i, quant_data in enumerate(quant_sol_list):
-                prefix = f'溶解性_定量_{i+1}'
-                if isinstance(quant_data, dict):
-                    for key, value in quant_data.items():
-                        base_record[f'{prefix}_{key}'] = value
-            
-            # 添加危害信息
-            for hazard_type, hazards in record.get('hazards', {}).items():
-                if isinstance(hazards, list):
-                    base_record[f'危害_{hazard_type}'] = '; '.join(hazards)
-                elif isinstance(hazards, dict):
-                    for sub_type, sub_hazards in hazards.items():
-                        base_record[f'危害_{hazard_type}_{sub_type}'] = '; '.join(sub_hazards)
-            
-            flattened.append(base_record)
-        
-        return flattened
+        return [self.flatten_record(record) for record in processed_data]
     
     def process_complete_pipeline(self, input_file: str, output_dir: str) -> Dict[str, Any]:
         """完整的数据处理流水线"""
@@ -4,23 +4,93 @@ Neo4j导出工具
 """
 
 import pandas as pd
-import json
+import codecs
+import itertools
 import os
 from typing import Dict, List, Any, Optional
+from ..common_utils import write_json
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+
+def _write_csv(df: pd.DataFrame, file_path: str):
+    """
+    写出带BOM的UTF-8 CSV（Excel兼容）。安装 pyarrow 时使用其多线程写入器，
+    列中混有无法转换或无法写成CSV的值（如列表、字典）时退回 DataFrame.to_csv。
+    """
+    if pacsv is not None:
+        # 先写入内存缓冲区，成功后才落盘，避免写到一半失败时留下截断的文件
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            pacsv.write_csv(table, sink, write_options=pacsv.WriteOptions(include_header=True))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            sink = None
+        if sink is not None:
+            with open(file_path, 'wb') as f:
+                f.write(codecs.BOM_UTF8)
+                f.write(sink.getvalue())
+            return
+    
+    df.to_csv(file_path, index=False, encoding='utf-8-sig')
 
 
 class Neo4jExporter:
     def __init__(self, config_path: Optional[str] = None):
         """初始化Neo4j导出器"""
         self.config_path = config_path
-        self.node_id_counter = 0
-        self.nodes = {}  # 存储所有节点
-        self.relationships = []  # 存储所有关系
+        self.reset_node_ids()
+        # 节点按列存储：ID、标签、属性字典三个并列列表，避免为每个节点再包一层字典
+        self.node_ids = []
+        self.node_labels = []
+        self.node_props = []
+        # 关系同样按列存储（起点ID、终点ID、类型），关系目前没有属性
+        self.rel_from = []
+        self.rel_to = []
+        self.rel_type = []
+    
+    @property
+    def nodes(self) -> Dict[str, Dict[str, Any]]:
+        """以节点ID为键的节点字典（由并列列表组装，用于JSON导出和调试）"""
+        return {
+            node_id: {'id': node_id, 'label': label, 'properties': props}
+            for node_id, label, props in zip(self.node_ids, self.node_labels, self.node_props)
+        }
+    
+    @property
+    def relationships(self) -> List[Dict[str, Any]]:
+        """关系字典列表（由并列列表组装，用于JSON导出和调试）"""
+        return [
+            {'from': from_id, 'to': to_id, 'type': rel_type, 'properties': {}}
+            for from_id, to_id, rel_type in zip(self.rel_from, self.rel_to, self.rel_type)
+        ]
         
+    def reset_node_ids(self):
+        """重置节点ID序列，下一个ID为 node_1"""
+        # 用 itertools.count 驱动的迭代器生成ID，省去每次的属性自增
+        self._node_id_iter = map('node_{}'.format, itertools.count(1))
+    
     def generate_node_id(self) -> str:
         """生成唯一的节点ID"""
-        self.node_id_counter += 1
-        return f"node_{self.node_id_counter}"
+        return next(self._node_id_iter)
+    
+    def add_node(self, label: str, properties: Dict[str, Any]) -> str:
+        """添加节点，返回新节点ID"""
+        node_id = next(self._node_id_iter)
+        self.node_ids.append(node_id)
+        self.node_labels.append(label)
+        self.node_props.append(properties)
+        return node_id
+    
+    def add_relationship(self, from_id: str, to_id: str, rel_type: str):
+        """添加关系"""
+        self.rel_from.append(from_id)
+        self.rel_to.append(to_id)
+        self.rel_type.append(rel_type)
     
     def create_chemical_nodes(self, processed_data: List[Dict[str, Any]]) -> Dict[str, str]:
         """创建化学品节点"""
@@ -32,325 +102,202 @@ class Neo4jExporter:
                 continue
             
             chemical_name = basic_info['品名']
-            node_id = self.generate_node_id()
-            
-            # 创建化学品节点
-            node_data = {
-                'id': node_id,
-                'label': 'Chemical',
-                'properties': {
-                    '品名': chemical_name,
-                    'CAS号': basic_info.get('CAS号', ''),
-                    '外观与性状': basic_info.get('外观与性状', ''),
-                    '室温状态': basic_info.get('室温状态', ''),
-                    '原始行号': record.get('原始行号', '')
-                }
+            properties = {
+                '品名': chemical_name,
+                'CAS号': basic_info.get('CAS号', ''),
+                '外观与性状': basic_info.get('外观与性状', ''),
+                '室温状态': basic_info.get('室温状态', ''),
+                '原始行号': record.get('原始行号', '')
             }
             
-            # 清理空值
-            node_data['properties'] = {k: v for k, v in node_data['properties'].items() if v}
-            
-            self.nodes[node_id] = node_data
+            # 创建化学品节点（清理空值）
+            node_id = self.add_node('Chemical', {k: v for k, v in properties.items() if v})
             chemical_nodes[chemical_name] = node_id
         
         return chemical_nodes
     
-    def create_alias_relationships(self, processed_data: List[Dict[str, Any]], chemical_nodes: Dict[str, str]):
-        """创建别名关系"""
-        for record in processed_data:
-            basic_info = record.get('basic_info', {})
-            chemical_name = basic_info.get('品名')
-            
-            if not chemical_name or chemical_name not in chemical_nodes:
+    def _emit_aliases(self, chemical_id: str, record: Dict[str, Any], chemical_nodes: Dict[str, str]):
+        """创建别名节点和关系"""
+        aliases = record.get('aliases', [])
+        
+        for alias in aliases:
+            if not alias or not alias.strip():
                 continue
-            
-            main_chemical_id = chemical_nodes[chemical_name]
-            aliases = record.get('aliases', [])
-            
-            for alias in aliases:
-                if not alias or not alias.strip():
-                    continue
 
-                alias_id = None
-                if alias in chemical_nodes:
-                    alias_id = chemical_nodes[alias]
-                else:
-                    alias_id = self.generate_node_id()
-                    alias_node = {
-                        'id': alias_id,
-                        'label': 'Chemical',
-                        'properties': {
-                            '品名': alias,
-                            '是别名': True
-                        }
-                    }
-                    self.nodes[alias_id] = alias_node
-                    chemical_nodes[alias] = alias_id
-                
-                if alias_id != main_chemical_id:
-                    relationship = {
-                        'from': main_chemical_id,
-                        'to': alias_id,
-                        'type': 'HAS_ALIAS',
-                        'properties': {}
-                    }
-                    self.relationships.append(relationship)
+            alias_id = None
+            if alias in chemical_nodes:
+                alias_id = chemical_nodes[alias]
+            else:
+                alias_id = self.add_node('Chemical', {'品名': alias, '是别名': True})
+                chemical_nodes[alias] = alias_id
+            
+            if alias_id != chemical_id:
+                self.add_relationship(chemical_id, alias_id, 'HAS_ALIAS')
     
-    def create_property_nodes(self, processed_data: List[Dict[str, Any]], chemical_nodes: Dict[str, str]):
+    def _emit_properties(self, chemical_id: str, record: Dict[str, Any]):
         """创建物理性质节点和关系"""
-        for record in processed_data:
-            basic_info = record.get('basic_info', {})
-            chemical_name = basic_info.get('品名')
-            
-            if not chemical_name or chemical_name not in chemical_nodes:
+        physical_properties = record.get('physical_properties', {})
+        
+        for prop_name, prop_values in physical_properties.items():
+            if not prop_values:
                 continue
-            
-            chemical_id = chemical_nodes[chemical_name]
-            physical_properties = record.get('physical_properties', {})
-            
-            for prop_name, prop_values in physical_properties.items():
-                if not prop_values:
-                    continue
 
-                # prop_values 现在是一个字典列表
-                for prop_data in prop_values:
-                    prop_id = self.generate_node_id()
-                    
-                    # 构建节点属性
-                    node_props = {'属性名': prop_name}
-                    node_props.update(prop_data) # 合并提取的属性
-
-                    prop_node = {
-                        'id': prop_id,
-                        'label': 'PhysicalProperty',
-                        'properties': node_props
-                    }
-                    self.nodes[prop_id] = prop_node
-                    
-                    relationship = {
-                        'from': chemical_id,
-                        'to': prop_id,
-                        'type': 'HAS_PROPERTY',
-                        'properties': {}
-                    }
-                    self.relationships.append(relationship)
+            # prop_values 现在是一个字典列表
+            for prop_data in prop_values:
+                # 节点属性：属性名 + 提取的属性
+                prop_id = self.add_node('PhysicalProperty', {'属性名': prop_name, **prop_data})
+                
+                self.add_relationship(chemical_id, prop_id, 'HAS_PROPERTY')
 
-    def create_storage_nodes(self, processed_data: List[Dict[str, Any]], chemical_nodes: Dict[str, str]):
+    def _emit_storage(self, chemical_id: str, record: Dict[str, Any]):
         """创建存储条件节点和关系"""
-        for record in processed_data:
-            basic_info = record.get('basic_info', {})
-            chemical_name = basic_info.get('品名')
-            
-            if not chemical_name or chemical_name not in chemical_nodes:
-                continue
-            
-            chemical_id = chemical_nodes[chemical_name]
-            storage_conditions = record.get('storage_conditions', {})
-            
-            for condition_type, conditions in storage_conditions.items():
-                for condition in conditions:
-                    storage_id = self.generate_node_id()
-                    storage_node = {
-                        'id': storage_id,
-                        'label': 'Storage',
-                        'properties': {
-                            '存储类型': condition_type,
-                            '存储条件': condition
-                        }
-                    }
-                    self.nodes[storage_id] = storage_node
-                    
-                    relationship = {
-                        'from': chemical_id,
-                        'to': storage_id,
-                        'type': 'REQUIRES_STORAGE',
-                        'properties': {}
-                    }
-                    self.relationships.append(relationship)
+        storage_conditions = record.get('storage_conditions', {})
+        
+        for condition_type, conditions in storage_conditions.items():
+            for condition in conditions:
+                storage_id = self.add_node('Storage', {'存储类型': condition_type, '存储条件': condition})
+                
+                self.add_relationship(chemical_id, storage_id, 'REQUIRES_STORAGE')
     
-    def create_solubility_nodes(self, processed_data: List[Dict[str, Any]], chemical_nodes: Dict[str, str]):
+    def _emit_solubility(self, chemical_id: str, record: Dict[str, Any]):
         """创建溶解性节点和关系"""
-        for record in processed_data:
-            basic_info = record.get('basic_info', {})
-            chemical_name = basic_info.get('品名')
-            
-            if not chemical_name or chemical_name not in chemical_nodes:
-                continue
-            
-            chemical_id = chemical_nodes[chemical_name]
-            solubility_info = record.get('solubility', {})
+        solubility_info = record.get('solubility', {})
+        
+        # 处理定性溶解性
+        for solvent, solubility in solubility_info.get('qualitative', {}).items():
+            solubility_id = self.add_node('QualitativeSolubility', {'溶剂': solvent, '溶解性': solubility})
             
-            # 处理定性溶解性
-            for solvent, solubility in solubility_info.get('qualitative', {}).items():
-                solubility_id = self.generate_node_id()
-                solubility_node = {
-                    'id': solubility_id,
-                    'label': 'QualitativeSolubility',
-                    'properties': {
-                        '溶剂': solvent,
-                        '溶解性': solubility
-                    }
-                }
-                self.nodes[solubility_id] = solubility_node
-                
-                relationship = {
-                    'from': chemical_id,
-                    'to': solubility_id,
-                    'type': 'HAS_SOLUBILITY',
-                    'properties': {}
-                }
-                self.relationships.append(relationship)
+            self.add_relationship(chemical_id, solubility_id, 'HAS_SOLUBILITY')
 
-            # 处理定量溶解性
-            for quant_data in solubility_info.get('quantitative', []):
-                solubility_id = self.generate_node_id()
-                solubility_node = {
-                    'id': solubility_id,
-                    'label': 'QuantitativeSolubility',
-                    'properties': quant_data # 直接使用提取的字典
-                }
-                self.nodes[solubility_id] = solubility_node
-                
-                relationship = {
-                    'from': chemical_id,
-                    'to': solubility_id,
-                    'type': 'HAS_SOLUBILITY',
-                    'properties': {}
-                }
-                self.relationships.append(relationship)
+        # 处理定量溶解性
+        for quant_data in solubility_info.get('quantitative', []):
+            # 直接使用提取的字典
+            solubility_id = self.add_node('QuantitativeSolubility', quant_data)
+            
+            self.add_relationship(chemical_id, solubility_id, 'HAS_SOLUBILITY')
 
-    def create_hazard_nodes(self, processed_data: List[Dict[str, Any]], chemical_nodes: Dict[str, str]):
+    def _emit_hazards(self, chemical_id: str, record: Dict[str, Any]):
         """创建危害信息节点和关系"""
-        for record in processed_data:
-            basic_info = record.get('basic_info', {})
-            chemical_name = basic_info.get('品名')
-            
-            if not chemical_name or chemical_name not in chemical_nodes:
-                continue
-            
-            chemical_id = chemical_nodes[chemical_name]
-            hazards = record.get('hazards', {})
+        hazards = record.get('hazards', {})
+        
+        # 每个类别要么是字符串列表，要么是 分类->列表 的字典
+        for hazard_category, hazard_data in hazards.items():
+            if type(hazard_data) is not dict:
+                for hazard in hazard_data:
+                    hazard_id = self.add_node('SafetyInfo', {'危害类型': hazard_category, '危害描述': hazard})
+                    
+                    self.add_relationship(chemical_id, hazard_id, 'HAS_HAZARD')
             
-            for hazard_category, hazard_data in hazards.items():
-                if isinstance(hazard_data, list):
-                    for hazard in hazard_data:
-                        hazard_id = self.generate_node_id()
-                        hazard_node = {
-                            'id': hazard_id,
-                            'label': 'SafetyInfo',
-                            'properties': {
-                                '危害类型': hazard_category,
-                                '危害描述': hazard
-                            }
-                        }
-                        self.nodes[hazard_id] = hazard_node
+            else:
+                for sub_category, sub_hazards in hazard_data.items():
+                    for hazard in sub_hazards:
+                        hazard_id = self.add_node('SafetyInfo', {
+                            '危害类型': f"{hazard_category}_{sub_category}",
+                            '危害描述': hazard
+                        })
                         
-                        relationship = {
-                            'from': chemical_id,
-                            'to': hazard_id,
-                            'type': 'HAS_HAZARD',
-                            'properties': {}
-                        }
-                        self.relationships.append(relationship)
-                
-                elif isinstance(hazard_data, dict):
-                    for sub_category, sub_hazards in hazards.items():
-                        for hazard in sub_hazards:
-                            hazard_id = self.generate_node_id()
-                            hazard_node = {
-                                'id': hazard_id,
-                                'label': 'SafetyInfo',
-                                'properties': {
-                                    '危害类型': f"{hazard_category}_{sub_category}",
-                                    '危害描述': hazard
-                                }
-                            }
-                            self.nodes[hazard_id] = hazard_node
-                            
-                            relationship = {
-                                'from': chemical_id,
-                                'to': hazard_id,
-                                'type': 'HAS_HAZARD',
-                                'properties': {}
-                            }
-                            self.relationships.append(relationship)
+                        self.add_relationship(chemical_id, hazard_id, 'HAS_HAZARD')
     
     def export_to_neo4j_format(self, processed_data: List[Dict[str, Any]], output_dir: str):
         """导出为Neo4j格式"""
         print("开始导出Neo4j格式...")
         
         os.makedirs(output_dir, exist_ok=True)
-        self.node_id_counter = 0
-        self.nodes = {}
-        self.relationships = []
+        self.reset_node_ids()
+        self.node_ids = []
+        self.node_labels = []
+        self.node_props = []
+        self.rel_from = []
+        self.rel_to = []
+        self.rel_type = []
         
         chemical_nodes = self.create_chemical_nodes(processed_data)
         print(f"创建了 {len(chemical_nodes)} 个化学品节点")
         
-        self.create_alias_relationships(processed_data, chemical_nodes)
-        self.create_property_nodes(processed_data, chemical_nodes)
-        self.create_storage_nodes(processed_data, chemical_nodes)
-        self.create_solubility_nodes(processed_data, chemical_nodes)
-        self.create_hazard_nodes(processed_data, chemical_nodes)
+        # 每条记录所属的化学品节点ID只解析一次（品名缺失的记录为 None）；
+        # 需在生成别名节点之前计算，别名会向 chemical_nodes 中添加新名称
+        chem_id_by_record = [
+            chemical_nodes.get(record.get('basic_info', {}).get('品名')) for record in processed_data
+        ]
         
-        print(f"总共创建了 {len(self.nodes)} 个节点")
-        print(f"总共创建了 {len(self.relationships)} 个关系")
+        # 其余节点和关系在一次遍历中生成
+        for record, chemical_id in zip(processed_data, chem_id_by_record):
+            if chemical_id is None:
+                continue
+            
+            self._emit_aliases(chemical_id, record, chemical_nodes)
+            self._emit_properties(chemical_id, record)
+            self._emit_storage(chemical_id, record)
+            self._emit_solubility(chemical_id, record)
+            self._emit_hazards(chemical_id, record)
         
-        nodes_file = os.path.join(output_dir, 'nodes.csv')
-        self.save_nodes_csv(nodes_file)
+        print(f"总共创建了 {len(self.node_ids)} 个节点")
+        print(f"总共创建了 {len(self.rel_type)} 个关系")
+        
+        nodes_files = self.save_nodes_csv(output_dir)
         
         relationships_file = os.path.join(output_dir, 'relationships.csv')
         self.save_relationships_csv(relationships_file)
         
         cypher_file = os.path.join(output_dir, 'import_script.cypher')
-        self.generate_cypher_script(cypher_file)
+        self.generate_cypher_script(cypher_file, list(nodes_files))
         
         json_file = os.path.join(output_dir, 'neo4j_data.json')
         self.save_json_format(json_file)
         
         print(f"Neo4j导出文件已保存到: {output_dir}")
         return {
-            'nodes_file': nodes_file,
+            'nodes_files': nodes_files,
             'relationships_file': relationships_file,
             'cypher_file': cypher_file,
             'json_file': json_file
         }
     
-    def save_nodes_csv(self, file_path: str):
-        """保存节点为CSV格式"""
-        nodes_data = []
-        for node in self.nodes.values():
-            row = {
-                'id': node['id'],
-                'label': node['label']
-            }
-            for key, value in node['properties'].items():
-                row[key] = value
-            nodes_data.append(row)
+    def node_label_order(self) -> List[str]:
+        """节点标签列表：Chemical 在前，其余按首次出现的顺序"""
+        labels = dict.fromkeys(self.node_labels)
+        return sorted(labels, key=lambda label: label != 'Chemical')
+    
+    def save_nodes_csv(self, output_dir: str) -> Dict[str, str]:
+        """
+        按标签分别保存节点为CSV格式（nodes_<标签>.csv），返回 标签 -> 文件路径。
+        每个文件只含该标签节点及其用到的属性列，导入时各标签可独立读取，无需逐行过滤。
+        """
+        positions = {label: [] for label in self.node_label_order()}
+        for pos, label in enumerate(self.node_labels):
+            positions[label].append(pos)
+        
+        nodes_files = {}
+        for label, label_positions in positions.items():
+            # 按列组装：属性字典列表由 json_normalize 展开为列，再在最前面插入 id 列
+            df = pd.json_normalize([self.node_props[pos] for pos in label_positions], max_level=0)
+            df.insert(0, 'id', [self.node_ids[pos] for pos in label_positions])
+            file_path = os.path.join(output_dir, f'nodes_{label}.csv')
+            # 修复Excel兼容性：写入BOM
+            _write_csv(df, file_path)
+            nodes_files[label] = file_path
         
-        df = pd.DataFrame(nodes_data)
-        # 修复Excel兼容性：使用 'utf-8-sig' 编码写入BOM
-        df.to_csv(file_path, index=False, encoding='utf-8-sig')
+        return nodes_files
     
     def save_relationships_csv(self, file_path: str):
         """保存关系为CSV格式"""
-        relationships_data = []
-        for rel in self.relationships:
-            row = {
-                'from_id': rel['from'],
-                'to_id': rel['to'],
-                'type': rel['type']
-            }
-            for key, value in rel['properties'].items():
-                row[key] = value
-            relationships_data.append(row)
-        
-        df = pd.DataFrame(relationships_data)
-        # 修复Excel兼容性：使用 'utf-8-sig' 编码写入BOM
-        df.to_csv(file_path, index=False, encoding='utf-8-sig')
+        df = pd.DataFrame({'from_id': self.rel_from, 'to_id': self.rel_to, 'type': self.rel_type})
+        # 修复Excel兼容性：写入BOM
+        _write_csv(df, file_path)
     
-    def generate_cypher_script(self, file_path: str):
-        """生成Cypher导入脚本"""
+    def generate_cypher_script(self, file_path: str, labels: Optional[List[str]] = None):
+        """生成Cypher导入脚本，labels 为已导出节点文件的标签，默认取当前节点的全部标签"""
+        if labels is None:
+            labels = self.node_label_order()
+        
+        # 每个非 Chemical 标签一个导入块，直接读取该标签的节点文件
+        other_label_imports = '\n'.join(f"""CALL apoc.periodic.iterate(
+  "LOAD CSV WITH HEADERS FROM 'file:///nodes_{label}.csv' AS row RETURN row",
+  "CREATE (n:`{label}`) SET n = apoc.map.clean(row, ['id'], [null, '']), n.temp_id = row.id",
+  {{batchSize: 10000, parallel: true, concurrency: 8}}
+);
+""" for label in labels if label != 'Chemical')
+        
         cypher_script = """
 // 1. 清空数据库（可选，请谨慎使用）
 // MATCH (n) DETACH DELETE n;
@@ -360,24 +307,22 @@ class Neo4jExporter:
 CREATE CONSTRAINT chemical_name IF NOT EXISTS FOR (c:Chemical) REQUIRE c.品名 IS UNIQUE;
 
 // 3. 导入Chemical节点 (使用 apoc.periodic.iterate)
+// MERGE 同名化学品会争用同一把锁，保持串行；加大批次以减少事务数
 CALL apoc.periodic.iterate(
-  "LOAD CSV WITH HEADERS FROM 'file:///nodes.csv' AS row WITH row WHERE row.label = 'Chemical' AND row.品名 IS NOT NULL AND trim(row.品名) <> '' RETURN row",
-  "MERGE (n:Chemical {品名: row.品名}) SET n += apoc.map.clean(row, ['id', 'label', '品名'], [null, '']), n.temp_id = row.id",
-  {batchSize: 1000, parallel: false}
-);
-
-// 4. 导入其他所有类型的节点 (使用 apoc.periodic.iterate)
-CALL apoc.periodic.iterate(
-  "LOAD CSV WITH HEADERS FROM 'file:///nodes.csv' AS row WITH row WHERE row.label <> 'Chemical' RETURN row",
-  "CALL apoc.create.node([row.label], apoc.map.clean(row, ['id', 'label'], [null, ''])) YIELD node SET node.temp_id = row.id",
-  {batchSize: 1000, parallel: false}
+  "LOAD CSV WITH HEADERS FROM 'file:///nodes_Chemical.csv' AS row WITH row WHERE row.品名 IS NOT NULL AND trim(row.品名) <> '' RETURN row",
+  "MERGE (n:Chemical {品名: row.品名}) SET n += apoc.map.clean(row, ['id', '品名'], [null, '']), n.temp_id = row.id",
+  {batchSize: 10000, parallel: false}
 );
 
+// 4. 导入其他所有类型的节点 (每个标签一个文件，使用 apoc.periodic.iterate)
+// 每行都创建新节点，批次之间互不冲突，可以并行
+""" + other_label_imports + """
 // 5. 导入关系 (使用 apoc.periodic.iterate)
+// 并行批次可能在同一化学品节点上发生锁冲突，失败的批次自动重试
 CALL apoc.periodic.iterate(
   "LOAD CSV WITH HEADERS FROM 'file:///relationships.csv' AS row RETURN row",
   "MATCH (from {temp_id: row.from_id}) MATCH (to {temp_id: row.to_id}) CALL apoc.merge.relationship(from, row.type, {}, apoc.map.clean(row, ['from_id', 'to_id', 'type'], [null, '']), to) YIELD rel",
-  {batchSize: 1000, parallel: false}
+  {batchSize: 5000, parallel: true, concurrency: 4, retries: 3}
 );
 
 // 6. 清理临时ID
@@ -401,20 +346,17 @@ CREATE INDEX hazard_type IF NOT EXISTS FOR (h:SafetyInfo) ON (h.危害类型);
             'nodes': list(self.nodes.values()),
             'relationships': self.relationships,
             'statistics': {
-                'total_nodes': len(self.nodes),
-                'total_relationships': len(self.relationships),
+                'total_nodes': len(self.node_ids),
+                'total_relationships': len(self.rel_type),
                 'node_types': {},
                 'relationship_types': {}
             }
         }
         
-        for node in self.nodes.values():
-            label = node['label']
+        for label in self.node_labels:
             export_data['statistics']['node_types'][label] = export_data['statistics']['node_types'].get(label, 0) + 1
         
-        for rel in self.relationships:
-            rel_type = rel['type']
+        for rel_type in self.rel_type:
             export_data['statistics']['relationship_types'][rel_type] = export_data['statistics']['relationship_types'].get(rel_type, 0) + 1
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+        write_json(export_data, file_path)
\ No newline at end of file
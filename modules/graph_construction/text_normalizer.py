@@ -3,8 +3,14 @@
 用于统一相似但表述不同的内容
 """
 
+import functools
+import math
+import os
 import re
+from collections import Counter, OrderedDict, defaultdict
+import numpy as np
 from typing import List, Dict, Tuple, Optional, Any
+from ..common_utils import CachedStateMixin
 try:
     import jieba
 except ImportError:
@@ -14,17 +20,176 @@ try:
 except ImportError:
     fuzz = None
     process = None
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process, utils as rf_utils
+except ImportError:
+    rf_fuzz = None
+    rf_process = None
+    rf_utils = None
 try:
     import yaml
 except ImportError:
     yaml = None
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# 数值提取正则（模块级预编译）
+# 温度范围：(可选负号)数字(可选小数) (范围指示符) (可选负号)数字(可选小数) (单位)
+# 范围与单值合并为一个正则一次扫描，同一位置优先匹配范围，按 lastgroup ('range'/'point') 分派
+_TEMP_RE = re.compile(
+    r'(?P<range>(?P<min>-?\d+(?:\.\d+)?)\s*(?:-|~|to|至)\s*(?P<max>-?\d+(?:\.\d+)?)\s*(?P<range_unit>[°℃CKF]))'
+    r'|(?P<point>(?P<value>-?\d+(?:\.\d+)?)\s*(?P<point_unit>[°℃CKF]))',
+    re.IGNORECASE
+)
+# 压力/密度：数字 (单位) (可选的 "at" 或 "@" 或 "在") (可选的温度条件)
+_PRESSURE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(kPa|Pa|hPa|MPa|bar|atm|mmHg)(?:\s*(?:at|@|在)\s*(-?\d+(?:\.\d+)?\s*[°℃CKF]))?', re.IGNORECASE)
+_DENSITY_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(g/cm³|g/ml|kg/m³)(?:\s*(?:at|@|在)\s*(-?\d+(?:\.\d+)?\s*[°℃CKF]))?', re.IGNORECASE)
+# 定量溶解度：(数字)(单位)/(数字)(单位) (可选条件)
+_SOLUBILITY_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(g|mg)\s*/\s*(\d+(?:\.\d+)?)\s*(mL|L|g|mg)\s*(?:\((.+?)\))?', re.IGNORECASE)
+_LEL_RE = re.compile(r'LEL[:\s]*(\d+(?:\.\d+)?)%?', re.IGNORECASE)
+_UEL_RE = re.compile(r'UEL[:\s]*(\d+(?:\.\d+)?)%?', re.IGNORECASE)
+
+# 危害分类关键词（按优先级排列，命中第一个即归类；未命中归入"其他"）
+_HAZARD_CATEGORY_PATTERNS = (
+    ('急性毒性', re.compile('中毒|有毒|致命|急性')),
+    ('皮肤刺激', re.compile('皮肤|灼伤|刺激')),
+    ('眼部刺激', re.compile('眼')),
+    ('呼吸道刺激', re.compile('呼吸|吸入')),
+    ('致癌性', re.compile('癌')),
+    ('致突变性', re.compile('突变')),
+    ('生殖毒性', re.compile('生殖|胎儿')),
+)
+_HAZARD_CATEGORIES = tuple(category for category, _ in _HAZARD_CATEGORY_PATTERNS) + ('其他',)
+# 危害描述的分隔符
+_HAZARD_SEPARATORS = (';', '；', '。')
+
+# 列表型字符串的默认分隔符
+_DEFAULT_SPLIT_RE = re.compile(r'[;；,，、]')
+
+# 进程级YAML配置缓存：路径 -> (mtime, size, 解析结果)，按LRU淘汰
+_CONFIG_CACHE: 'OrderedDict[str, Tuple[float, int, dict]]' = OrderedDict()
+CONFIG_CACHE_SIZE = 100
+
+
+def _load_yaml_cached(config_path: str) -> dict:
+    """读取并解析YAML配置；文件的修改时间和大小未变时直接复用上次的解析结果（调用方不得修改返回值）"""
+    path = os.path.abspath(config_path)
+    st = os.stat(path)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        _CONFIG_CACHE.move_to_end(path)
+        return cached[2]
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f) or {}
+    
+    _CONFIG_CACHE[path] = (st.st_mtime, st.st_size, config)
+    _CONFIG_CACHE.move_to_end(path)
+    if len(_CONFIG_CACHE) > CONFIG_CACHE_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+    return config
+
+
+def _replacement_pattern(terms) -> Optional[re.Pattern]:
+    """将待替换词编译为一个交替正则，长词在前，保证一次扫描时优先匹配最长的词"""
+    terms = sorted(terms, key=len, reverse=True)
+    if not terms:
+        return None
+    return re.compile('|'.join(map(re.escape, terms)))
+
+
+def _replacement_automaton(mapping: Dict[str, str]):
+    """将替换映射构建为 Aho-Corasick 自动机，每个词存储 (词长, 替换文本)"""
+    automaton = ahocorasick.Automaton()
+    for term, replacement in mapping.items():
+        if term:
+            automaton.add_word(term, (len(term), replacement))
+    if len(automaton) == 0:
+        return None
+    automaton.make_automaton()
+    return automaton
+
+
+@functools.lru_cache(maxsize=64)
+def _separator_pattern(separators: Tuple[str, ...]) -> re.Pattern:
+    """将一组分隔符编译为交替正则（长分隔符在前），按分隔符元组缓存"""
+    seps = sorted((sep for sep in separators if sep), key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, seps)))
+
+
+def _split_translatable(mapping: Dict[str, str]) -> Tuple[Dict[int, str], Dict[str, str]]:
+    """
+    拆出可直接用 str.translate 查表替换的单字符词：替换文本非空，且该字符及其替换文本中的字符都不出现在
+    任何多字符词里，查表替换与多字符匹配互不影响，结果与一次性最左最长替换相同。
+    返回 (translate 表, 其余需匹配的映射)
+    """
+    rest = {term: value for term, value in mapping.items() if len(term) != 1 or not value}
+    single = {term: value for term, value in mapping.items() if term not in rest}
+    # 移入 rest 的词会扩大受限字符集，反复筛选直到稳定
+    changed = True
+    while changed:
+        rest_chars = set(''.join(rest))
+        changed = False
+        for term, value in list(single.items()):
+            if term in rest_chars or rest_chars.intersection(value):
+                rest[term] = single.pop(term)
+                changed = True
+    return {ord(term): value for term, value in single.items()}, rest
 
 
-class TextNormalizer:
+def _compile_replacer(mapping: Dict[str, str]):
+    """编译替换匹配器：安装 pyahocorasick 时使用自动机，否则退回交替正则"""
+    if ahocorasick is not None:
+        return _replacement_automaton(mapping)
+    return _replacement_pattern(mapping)
+
+
+def _apply_replacements(matcher, mapping: Dict[str, str], text: str) -> str:
+    """一次扫描完成全部替换：重叠时取最左、最长的词，替换结果不再参与匹配"""
+    if matcher is None:
+        return text
+    if isinstance(matcher, re.Pattern):
+        return matcher.sub(lambda m: mapping[m.group(0)], text)
+    
+    # 自动机给出全部（可能重叠的）命中，先按起点保留最长的词，再自左向右跳过重叠部分
+    longest = {}
+    for end, (length, replacement) in matcher.iter(text):
+        start = end - length + 1
+        if length > longest.get(start, (0,))[0]:
+            longest[start] = (length, replacement)
+    if not longest:
+        return text
+    
+    parts = []
+    pos = 0
+    for start in sorted(longest):
+        if start < pos:
+            continue
+        length, replacement = longest[start]
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = start + length
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+class TextNormalizer(CachedStateMixin):
+    # normalize_text / normalize_units 结果缓存容量
+    NORMALIZE_CACHE_SIZE = 65536
+    _TRANSIENT_ATTRS = ('_normalize_text_cached', '_normalize_units_cached')
+
     def __init__(self, config_path: Optional[str] = None):
         """初始化文本标准化器"""
         self.synonyms_map = {}
         self.unit_map = {}
+        self._synonym_matcher = None
+        self._synonym_has_ascii = False
+        self._unit_matcher = None
+        self._unit_translate = {}
+        self._init_caches()
         self.unit_conversions = {
             'pressure': {
                 'kpa': 1.0,
@@ -46,8 +211,7 @@ class TextNormalizer:
             print("Warning: PyYAML not installed. Using default configuration.")
             return
             
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml_cached(config_path)
         
         # 构建同义词映射
         synonyms = config.get('processing', {}).get('text_normalization', {}).get('synonyms', {})
@@ -63,29 +227,59 @@ class TextNormalizer:
             canonical = unit_list[0]
             for unit in unit_list:
                 self.unit_map[unit] = canonical
+        
+        self.compile_replacements()
+    
+    def compile_replacements(self):
+        """根据 synonyms_map / unit_map 重新编译替换匹配器（直接修改映射后需调用）"""
+        self._synonym_matcher = _compile_replacer(self.synonyms_map)
+        # 同义词全为非ASCII（中文）时，纯ASCII文本不可能命中，可直接跳过匹配
+        self._synonym_has_ascii = any(term.isascii() for term in self.synonyms_map)
+        # 单位中的单字符符号先用查表替换，剩余的多字符单位再走匹配器
+        self._unit_translate, multi_units = _split_translatable(self.unit_map)
+        self._unit_matcher = _compile_replacer(multi_units)
+        # 映射已变化，丢弃按旧映射得到的缓存结果
+        self._init_caches()
+    
+    def _init_caches(self):
+        """按原始字符串缓存 normalize_text 和 normalize_units 的结果"""
+        cache = functools.lru_cache(maxsize=self.NORMALIZE_CACHE_SIZE)
+        self._normalize_text_cached = cache(self._normalize_text)
+        self._normalize_units_cached = cache(self._normalize_units)
+    
+    def clear_caches(self):
+        """清空标准化结果缓存"""
+        self._init_caches()
     
     def normalize_text(self, text: str) -> Optional[str]:
+        """标准化文本（结果按原始字符串缓存）"""
+        return self._normalize_text_cached(text)
+    
+    def normalize_units(self, text: str) -> str:
+        """标准化单位（结果按原始字符串缓存）"""
+        return self._normalize_units_cached(text)
+    
+    def _normalize_text(self, text: str) -> Optional[str]:
         """标准化文本"""
         if not text or text.strip() in ['N/A', '处理异常', '', 'null']:
             return None
         
         text = text.strip()
         
-        # 应用同义词映射
-        for synonym, canonical in self.synonyms_map.items():
-            text = text.replace(synonym, canonical)
+        # 应用同义词映射：一次扫描，重叠时取最长的同义词，替换结果不再参与匹配
+        if self._synonym_has_ascii or not text.isascii():
+            text = _apply_replacements(self._synonym_matcher, self.synonyms_map, text)
         
         return text
     
-    def normalize_units(self, text: str) -> str:
+    def _normalize_units(self, text: str) -> str:
         """标准化单位"""
         if not text:
             return text
         
-        for unit, canonical in self.unit_map.items():
-            text = text.replace(unit, canonical)
-        
-        return text
+        if self._unit_translate:
+            text = text.translate(self._unit_translate)
+        return _apply_replacements(self._unit_matcher, self.unit_map, text)
     
     def _convert_temp_to_celsius(self, value: float, unit: str) -> float:
         """将温度转换为摄氏度"""
@@ -106,12 +300,13 @@ class TextNormalizer:
         if not text:
             return []
         
-        # 模式：(可选负号)数字(可选小数) (可选范围指示符) (可选负号)数字(可选小数) (单位)
-        pattern = r'(-?\d+(?:\.\d+)?)\s*(?:-|~|to|至)\s*(-?\d+(?:\.\d+)?)\s*([°℃CKF])'
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        
         results = []
-        for start_str, end_str, unit_str in matches:
+        points = []
+        for m in _TEMP_RE.finditer(text):
+            if m.lastgroup == 'point':
+                points.append(m.group('value', 'point_unit'))
+                continue
+            start_str, end_str, unit_str = m.group('min', 'max', 'range_unit')
             try:
                 min_val = float(start_str)
                 max_val = float(end_str)
@@ -130,11 +325,9 @@ class TextNormalizer:
             except (ValueError, IndexError):
                 continue
         
-        # 如果没有找到范围，则查找单个值
+        # 如果没有找到范围，则使用单个值
         if not results:
-            pattern = r'(-?\d+(?:\.\d+)?)\s*([°℃CKF])'
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for val_str, unit_str in matches:
+            for val_str, unit_str in points:
                 try:
                     value = float(val_str)
                     unit = unit_str.upper().replace('℃', 'C')
@@ -158,12 +351,9 @@ class TextNormalizer:
         if not text:
             return []
         
-        # 模式: 数字 (单位) (可选的 "at" 或 "@" 或 "在") (可选的温度条件)
-        pattern = r'(\d+(?:\.\d+)?)\s*(kPa|Pa|hPa|MPa|bar|atm|mmHg)(?:\s*(?:at|@|在)\s*(-?\d+(?:\.\d+)?\s*[°℃CKF]))?'
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        
         results = []
-        for value_str, unit_str, condition_str in matches:
+        for m in _PRESSURE_RE.finditer(text):
+            value_str, unit_str, condition_str = m.groups()
             try:
                 value = float(value_str)
                 unit = unit_str.lower()
@@ -194,12 +384,9 @@ class TextNormalizer:
         if not text:
             return []
         
-        # 模式: 数字 (单位) (可选的 "at" 或 "@" 或 "在") (可选的温度条件)
-        pattern = r'(\d+(?:\.\d+)?)\s*(g/cm³|g/ml|kg/m³)(?:\s*(?:at|@|在)\s*(-?\d+(?:\.\d+)?\s*[°℃CKF]))?'
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        
         results = []
-        for value_str, unit_str, condition_str in matches:
+        for m in _DENSITY_RE.finditer(text):
+            value_str, unit_str, condition_str = m.groups()
             try:
                 value = float(value_str)
                 unit = unit_str.lower()
@@ -236,12 +423,9 @@ class TextNormalizer:
         if not text:
             return []
         
-        # 模式: (数字)(单位)/(数字)(单位) (可选条件)
-        pattern = r'(\d+(?:\.\d+)?)\s*(g|mg)\s*/\s*(\d+(?:\.\d+)?)\s*(mL|L|g|mg)\s*(?:\((.+?)\))?'
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        
         results = []
-        for solute_mass, solute_unit, solvent_val, solvent_unit, condition in matches:
+        for m in _SOLUBILITY_RE.finditer(text):
+            solute_mass, solute_unit, solvent_val, solvent_unit, condition = m.groups()
             try:
                 results.append({
                     'solute_mass': float(solute_mass),
@@ -260,29 +444,132 @@ class TextNormalizer:
             return []
         
         if separators is None:
-            separators = [';', '；', ',', '，', '、']
-        
-        # 使用多个分隔符分割
-        parts = [text]
-        for sep in separators:
-            new_parts = []
-            for part in parts:
-                new_parts.extend(part.split(sep))
-            parts = new_parts
+            pattern = _DEFAULT_SPLIT_RE
+        else:
+            pattern = _separator_pattern(tuple(separators))
         
-        # 清理和过滤空值
-        return [part.strip() for part in parts if part.strip()]
+        # 一次扫描按全部分隔符分割，清理和过滤空值
+        parts = pattern.split(text) if pattern.pattern else [text]
+        return [part for part in map(str.strip, parts) if part]
+
+    # 每个名称最多返回的相似项数（与 fuzzywuzzy extractBests 默认值一致）
+    SIMILAR_LIMIT = 5
+    # 批量计算相似度矩阵时每块的最大单元数，限制内存占用
+    SIMILARITY_BLOCK_CELLS = 4_000_000
 
     def find_similar_terms(self, term: str, term_list: List[str], threshold: int = 80) -> List[str]:
         """查找相似的术语"""
-        if not term or not term_list or process is None:
+        if not term or not term_list:
             return []
         
-        similar = process.extractBests(term, term_list, score_cutoff=threshold)
+        if rf_process is not None:
+            similar = rf_process.extract(term, term_list, scorer=rf_fuzz.WRatio, processor=rf_utils.default_process,
+                                         score_cutoff=threshold, limit=self.SIMILAR_LIMIT)
+        elif process is not None:
+            similar = process.extractBests(term, term_list, score_cutoff=threshold)
+        else:
+            return []
         return [match[0] for match in similar]
     
+    def find_similar_groups(self, names: List[str], threshold: int = 80) -> List[List[str]]:
+        """
+        按 find_similar_terms 的规则为每个名称查找相似名称，返回包含多个名称的分组；
+        已归入某组的名称不再作为查询项。
+        安装 rapidfuzz 时用 process.cdist 分块批量计算相似度矩阵，否则逐个调用 find_similar_terms。
+        """
+        similar_groups = []
+        processed = set()
+        
+        if rf_process is None:
+            for name in names:
+                if name in processed:
+                    continue
+                
+                similar = self.find_similar_terms(name, names, threshold)
+                if len(similar) > 1:
+                    similar_groups.append(similar)
+                    processed.update(similar)
+            return similar_groups
+        
+        block_size = max(1, self.SIMILARITY_BLOCK_CELLS // max(len(names), 1))
+        for start in range(0, len(names), block_size):
+            block = names[start:start + block_size]
+            scores = rf_process.cdist(block, names, scorer=rf_fuzz.WRatio, processor=rf_utils.default_process,
+                                      score_cutoff=threshold, dtype=np.float64, workers=-1)
+            for name, row in zip(block, scores):
+                if name in processed or not name:
+                    continue
+                
+                # 得分达到阈值的候选按得分降序（同分保持原顺序）取前 SIMILAR_LIMIT 个
+                candidates = np.flatnonzero(row >= threshold)
+                candidates = candidates[np.argsort(-row[candidates], kind='stable')][:self.SIMILAR_LIMIT]
+                if len(candidates) > 1:
+                    similar = [names[i] for i in candidates]
+                    similar_groups.append(similar)
+                    processed.update(similar)
+        
+        return similar_groups
+    
+    def _name_shingles(self, name: str, ngram: int) -> set:
+        """名称预处理后的字符 n-gram 集合，不足 n 个字符时整体作为一个 n-gram"""
+        text = rf_utils.default_process(name) if rf_utils is not None else name.lower().strip()
+        if len(text) <= ngram:
+            return {text} if text else set()
+        return {text[i:i + ngram] for i in range(len(text) - ngram + 1)}
+    
+    def find_similar_groups_blocked(self, names: List[str], threshold: int = 80,
+                                    ngram: int = 2, min_jaccard: float = 0.3) -> List[List[str]]:
+        """
+        分块版 find_similar_groups：先用 n-gram 倒排索引找出 Jaccard 相似度不低于 min_jaccard 的候选，
+        只对候选计算模糊匹配得分，比较次数由 N² 降为约 N·k（k 为平均候选数）。
+        n-gram 重合度低但模糊得分高的名称对会被漏掉，结果是近似的。
+        
+        倒排索引使用前缀过滤：n-gram 按出现的名称数从少到多全局排序，Jaccard 不低于 t 的两个集合
+        各自最稀有的 |x| - ⌈t·|x|⌉ + 1 个 n-gram 必有交集，因此只需索引和查询这部分前缀。
+        "乙基"、"氯化" 等高频 n-gram 通常不在前缀中，不会让每个名称都与大量名称成为候选；候选集合不变。
+        """
+        shingles = [self._name_shingles(name, ngram) for name in names]
+        doc_freq = Counter(gram for grams in shingles for gram in grams)
+        prefixes = []
+        for grams in shingles:
+            ordered = sorted(grams, key=lambda gram: (doc_freq[gram], gram))
+            # 减去微小量避免浮点误差使 ⌈t·|x|⌉ 偏大、前缀过短
+            prefix_len = len(ordered) - math.ceil(min_jaccard * len(ordered) - 1e-9) + 1
+            prefixes.append(ordered[:max(prefix_len, 0)])
+        
+        postings = defaultdict(list)
+        for i, prefix in enumerate(prefixes):
+            for gram in prefix:
+                postings[gram].append(i)
+        
+        similar_groups = []
+        processed = set()
+        
+        for i, name in enumerate(names):
+            if name in processed or not name:
+                continue
+            
+            # 前缀相交的名称再按 共有 n-gram 数 / 并集大小 精确校验 Jaccard 相似度；候选保持原顺序，同分时与不分块一致
+            grams = shingles[i]
+            candidate_ids = {j for gram in prefixes[i] for j in postings[gram]}
+            candidates = [
+                names[j] for j in sorted(candidate_ids)
+                if len(grams & shingles[j]) / len(grams | shingles[j]) >= min_jaccard
+            ]
+            
+            similar = self.find_similar_terms(name, candidates, threshold)
+            if len(similar) > 1:
+                similar_groups.append(similar)
+                processed.update(similar)
+        
+        return similar_groups
+    
     def standardize_chemical_names(self, names: List[str]) -> Dict[str, str]:
-        """标准化化学品名称"""
+        """
+        标准化化学品名称：依次为每个未处理的名称在未处理名称中查找相似名称，组内最短的名称作为标准名称。
+        安装 rapidfuzz 时用 process.cdist 分块批量计算相似度矩阵，已处理的名称通过列掩码排除；
+        名称总与自身匹配，查询过的名称必然已处理，因此每块只需与其后的名称比较（上三角）。
+        """
         if not names:
             return {}
         
@@ -290,19 +577,52 @@ class TextNormalizer:
         name_groups = {}
         processed = set()
         
-        for name in names:
-            if name in processed:
-                continue
-            
-            # 查找相似名称
-            similar = self.find_similar_terms(name, [n for n in names if n not in processed])
+        if rf_process is None:
+            for name in names:
+                if name in processed:
+                    continue
+                
+                # 查找相似名称
+                similar = self.find_similar_terms(name, [n for n in names if n not in processed])
+                
+                if similar:
+                    # 选择最短的名称作为标准名称
+                    canonical = min(similar, key=len)
+                    for sim_name in similar:
+                        name_groups[sim_name] = canonical
+                        processed.add(sim_name)
             
-            if similar:
+            return name_groups
+        
+        threshold = 80
+        columns = defaultdict(list)
+        for i, name in enumerate(names):
+            columns[name].append(i)
+        available = np.ones(len(names), dtype=bool)
+        
+        block_size = max(1, self.SIMILARITY_BLOCK_CELLS // len(names))
+        for start in range(0, len(names), block_size):
+            block = names[start:start + block_size]
+            scores = rf_process.cdist(block, names[start:], scorer=rf_fuzz.WRatio, processor=rf_utils.default_process,
+                                      score_cutoff=threshold, dtype=np.float64, workers=-1)
+            for name, row in zip(block, scores):
+                if name in processed or not name:
+                    continue
+                
+                # 未处理且得分达到阈值的候选按得分降序（同分保持原顺序）取前 SIMILAR_LIMIT 个
+                candidates = np.flatnonzero(available[start:] & (row >= threshold))
+                candidates = candidates[np.argsort(-row[candidates], kind='stable')][:self.SIMILAR_LIMIT]
+                if len(candidates) == 0:
+                    continue
+                
                 # 选择最短的名称作为标准名称
+                similar = [names[start + i] for i in candidates]
                 canonical = min(similar, key=len)
                 for sim_name in similar:
                     name_groups[sim_name] = canonical
-                    processed.add(sim_name)
+                    if sim_name not in processed:
+                        processed.add(sim_name)
+                        available[columns[sim_name]] = False
         
         return name_groups
     
@@ -314,14 +634,12 @@ class TextNormalizer:
         results = {}
         
         # 提取LEL
-        lel_pattern = r'LEL[:\s]*(\d+(?:\.\d+)?)%?'
-        lel_match = re.search(lel_pattern, text, re.IGNORECASE)
+        lel_match = _LEL_RE.search(text)
         if lel_match:
             results['LEL'] = float(lel_match.group(1))
         
         # 提取UEL
-        uel_pattern = r'UEL[:\s]*(\d+(?:\.\d+)?)%?'
-        uel_match = re.search(uel_pattern, text, re.IGNORECASE)
+        uel_match = _UEL_RE.search(text)
         if uel_match:
             results['UEL'] = float(uel_match.group(1))
         
@@ -332,40 +650,17 @@ class TextNormalizer:
         if not hazard_text:
             return {}
         
-        categories = {
-            '急性毒性': [],
-            '皮肤刺激': [],
-            '眼部刺激': [],
-            '呼吸道刺激': [],
-            '致癌性': [],
-            '致突变性': [],
-            '生殖毒性': [],
-            '其他': []
-        }
+        categories = {category: [] for category in _HAZARD_CATEGORIES}
         
-        # 分割危害描述
-        hazards = self.split_list_string(hazard_text, [';', '；', '。'])
+        # 分割危害描述（split_list_string 已去除首尾空白和空项）
+        hazards = self.split_list_string(hazard_text, _HAZARD_SEPARATORS)
         
         for hazard in hazards:
-            hazard = hazard.strip()
-            if not hazard:
-                continue
-            
             # 根据关键词分类
-            if any(keyword in hazard for keyword in ['中毒', '有毒', '致命', '急性']):
-                categories['急性毒性'].append(hazard)
-            elif any(keyword in hazard for keyword in ['皮肤', '灼伤', '刺激']):
-                categories['皮肤刺激'].append(hazard)
-            elif any(keyword in hazard for keyword in ['眼', '眼睛', '眼部']):
-                categories['眼部刺激'].append(hazard)
-            elif any(keyword in hazard for keyword in ['呼吸', '吸入']):
-                categories['呼吸道刺激'].append(hazard)
-            elif any(keyword in hazard for keyword in ['致癌', '癌']):
-                categories['致癌性'].append(hazard)
-            elif any(keyword in hazard for keyword in ['致突变', '突变']):
-                categories['致突变性'].append(hazard)
-            elif any(keyword in hazard for keyword in ['生殖', '胎儿']):
-                categories['生殖毒性'].append(hazard)
+            for category, pattern in _HAZARD_CATEGORY_PATTERNS:
+                if pattern.search(hazard):
+                    categories[category].append(hazard)
+                    break
             else:
                 categories['其他'].append(hazard)
         
@@ -3,22 +3,228 @@
 基于多种策略进行JSON解析，确保稳定的结构化输出
 增强版：添加输出验证、属性映射、数据纠偏、严格模式支持
 """
+import functools
 import json
 import re
 import logging
-from typing import Any, Dict, List, Optional, Union, Set
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, Set
 from enum import Enum
 from difflib import SequenceMatcher
 
+from .common_utils import CachedStateMixin, run_chunked
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    from rapidfuzz import fuzz as rf_fuzz
+except ImportError:
+    rf_fuzz = None
+
 logger = logging.getLogger(__name__)
 
-# 无效值集合
-INVALID_VALUES = {
+# 不作为属性处理的元数据键
+_META_KEYS = frozenset({'attributes', 'entity_name', 'data_source', '实体名称'})
+
+# 无效值集合（小写形式）
+INVALID_VALUES = frozenset({
     '', 'null', 'none', 'n/a', 'na', 'undefined', 
     '[待补全]', '待补全', '暂无', '无', '未知',
     '...', '<具体值>', '<值>', '占位符',
     'placeholder', 'todo', 'tbd'
+})
+
+
+def json_loads(text: str) -> Any:
+    """
+    解析JSON文本；安装 orjson 时优先使用其解析器，失败时回退标准库
+    （标准库额外接受 NaN/Infinity 等非严格写法），抛出 json.JSONDecodeError
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _similarity_ratio(a: str, b: str) -> float:
+    """两个字符串的相似度（0~1）：安装 rapidfuzz 时用其 C++ 实现的 Indel 相似度，否则用 difflib"""
+    if rf_fuzz is not None:
+        return rf_fuzz.ratio(a, b) / 100
+    return SequenceMatcher(None, a, b).ratio()
+
+
+# 流式解码JSON数组元素
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WS_RE = re.compile(r'[ \t\n\r]*')
+
+
+def _iter_array_items(text: str) -> Iterator[Any]:
+    """逐个解码以 [ 开头的JSON数组中的元素，不构建完整列表；格式错误时抛出 json.JSONDecodeError"""
+    pos = _JSON_WS_RE.match(text, 1).end()
+    if text.startswith(']', pos):
+        return
+    while True:
+        item, pos = _JSON_DECODER.raw_decode(text, pos)
+        yield item
+        pos = _JSON_WS_RE.match(text, pos).end()
+        if text.startswith(']', pos):
+            return
+        if not text.startswith(',', pos):
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+        pos = _JSON_WS_RE.match(text, pos + 1).end()
+
+
+# 中文（弯）引号 -> ASCII 引号；用转义写法避免在编辑中被替换成普通引号
+_QUOTE_TAB = str.maketrans({'\u201c': '"', '\u201d': '"', '\u2018': "'", '\u2019': "'"})
+
+# markdown代码块标记：```json 开头标记与 ``` 结束标记，一次扫描全部移除
+_MD_FENCE_RE = re.compile(r'```json\s*\n?|\n?```(?!json)')
+
+# markdown代码块提取模式（按优先级）：```json 代码块、普通代码块、行内代码
+_MD_BLOCK_PATTERNS = [
+    re.compile(r'```json\s*\n?(.*?)\n?```', re.DOTALL | re.IGNORECASE),
+    re.compile(r'```\s*\n?(.*?)\n?```', re.DOTALL | re.IGNORECASE),
+    re.compile(r'`([^`]+)`', re.DOTALL | re.IGNORECASE),
+]
+
+# 占位符两端的括号
+_PLACEHOLDER_BRACKETS = {('<', '>'), ('[', ']')}
+# 属性名中的关键词
+_WORD_RE = re.compile(r'\w+')
+
+@functools.lru_cache(maxsize=1024)
+def _attr_patterns(attr: str) -> tuple:
+    """
+    按属性名编译 _extract_from_text 使用的模式，结果按属性名缓存。
+    返回 (属性名探测模式, 按优先级排列的匹配模式)；每个匹配模式都包含属性名本身，
+    探测不到属性名时所有模式都不可能匹配
+    """
+    escaped = re.escape(attr)
+    return re.compile(escaped, re.IGNORECASE), tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        rf'{escaped}\s*[：:]\s*["\']?([^"\'\n,}}]+)["\']?',
+        rf'["\']?{escaped}["\']?\s*[：:]\s*["\']?([^"\'\n,}}]+)["\']?',
+        rf'{escaped}\s*为\s*["\']?([^"\'\n,}}]+)["\']?',
+        rf'{escaped}\s*是\s*["\']?([^"\'\n,}}]+)["\']?',
+    ))
+
+
+# key-value 提取模式（按优先级）
+_KEY_VALUE_PATTERNS = [
+    re.compile(r'"([^"]+)"\s*:\s*"([^"]*)"'),  # "key": "value"
+    re.compile(r"'([^']+)'\s*:\s*'([^']*)'"),  # 'key': 'value'
+    re.compile(r'"([^"]+)"\s*:\s*(\d+(?:\.\d+)?)'),  # "key": number
+]
+# key: value (简单格式)，匹配过于宽松，仅在上面的结构化格式都没有结果时使用
+_LOOSE_KEY_VALUE_PATTERN = re.compile(r'([^:\n]+?):\s*([^\n,}]+)')
+_KEY_SEPARATOR_RE = re.compile(r'[:\n]')
+
+# 清理时移除的常见前导文字（{ 之前的内容另行截去）
+_PREFIX_STRIP_RE = re.compile(r'(?:以下是|返回|结果|JSON).*?[：:]\s*', re.IGNORECASE | re.DOTALL)
+
+# JSON格式修复
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+_UNQUOTED_KEY_RE = re.compile(r'(\{|\,)\s*([a-zA-Z_\u4e00-\u9fa5][a-zA-Z0-9_\u4e00-\u9fa5]*)\s*:')
+_CTRL_CHARS_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+_JSON_STRING_RE = re.compile(r'("(?:[^"\\]|\\.)*")')
+_LINE_COMMENT_RE = re.compile(r'//.*?\n')
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_DOUBLED_QUOTES_RE = re.compile(r'""([^"]+)""')
+_MISSING_COMMA_RE = re.compile(r'"\s*\n\s*"')
+_WS_RUN_RE = re.compile(r'\s*')
+
+# JSON片段扫描用的正则（按参与配平的开括号区分）：(片段起始括号, 片段内部记号)
+# 片段内的字符串字面量整体作为一个记号跳过，单独的 " 表示字符串未闭合
+_JSON_STRING_TOKEN = r'"[^"\\]*(?:\\.[^"\\]*)*"|"'
+_JSON_SCAN_RES = {
+    '{[': (re.compile(r'[{\[]'), re.compile(_JSON_STRING_TOKEN + r'|[{}\[\]]', re.DOTALL)),
+    '{': (re.compile(r'\{'), re.compile(_JSON_STRING_TOKEN + r'|[{}]', re.DOTALL)),
 }
+_JSON_CLOSERS = {'{': '}', '[': ']'}
+
+
+def _iter_json_candidates(text: str, openers: str = '{['):
+    """
+    线性扫描文本，按出现顺序产出括号配平的最外层片段。
+    openers 为 '{[' 时产出 {...} / [...]；为 '{' 时忽略方括号，只产出 {...}（可找出残缺数组中的对象）。
+    括号内跟踪字符串字面量（含转义），字符串中的括号不计入层级；括号不匹配时放弃当前片段。
+    到文本末尾括号仍未闭合时（如开头多出一个 {），产出其内部已配平的片段。
+    """
+    opener_re, token_re = _JSON_SCAN_RES[openers]
+    pos = 0
+    
+    while True:
+        # 片段之外直接跳到下一个起始括号
+        match = opener_re.search(text, pos)
+        if match is None:
+            return
+        start = match.start()
+        stack = [_JSON_CLOSERS[match.group()]]
+        # 每层的起点和其中已配平的直接子片段 (起点, 终点)；该层闭合时子片段随之丢弃
+        starts = [start]
+        children = [[]]
+        pos = match.end()
+        
+        while stack:
+            match = token_re.search(text, pos)
+            if match is None or match.group() == '"':
+                # 文本结束（或字符串未闭合）时仍未闭合的各层中，已配平的子片段即为最外层片段，按文本顺序产出
+                for spans in children:
+                    for span_start, span_end in spans:
+                        yield text[span_start:span_end]
+                return
+            token = match.group()
+            pos = match.end()
+            if token[0] == '"':
+                continue
+            if token in _JSON_CLOSERS:
+                stack.append(_JSON_CLOSERS[token])
+                starts.append(match.start())
+                children.append([])
+            elif token != stack.pop():
+                # 括号不匹配，放弃当前片段
+                break
+            else:
+                span_start = starts.pop()
+                children.pop()
+                if stack:
+                    children[-1].append((span_start, pos))
+                else:
+                    yield text[start:pos]
+
+
+def _sub_before_last(pattern: re.Pattern, repl: str, text: str, delimiters: str) -> str:
+    """
+    pattern 的每个匹配都以 delimiters 中的某个字符（及其后的空白）结尾时使用：
+    只对最后一个分隔符之前的部分做替换。
+    最后一个分隔符之后的起点不可能匹配，而懒惰的 .*? 会从每个这样的起点扫描到文本末尾（平方级）
+    """
+    cut = max(text.rfind(d) for d in delimiters) + 1
+    if not cut:
+        return text
+    cut = _WS_RUN_RE.match(text, cut).end()
+    return pattern.sub(repl, text[:cut]) + text[cut:]
+
+
+def _iter_loose_key_values(text: str) -> Iterator[tuple]:
+    """
+    与 _LOOSE_KEY_VALUE_PATTERN.findall(text) 结果相同，但为线性时间：
+    某个起点匹配失败时，到下一个 : 或换行为止的其余起点会以同样的方式失败，直接跳过
+    """
+    pos = 0
+    while pos < len(text):
+        match = _LOOSE_KEY_VALUE_PATTERN.match(text, pos)
+        if match:
+            yield match.groups()
+            pos = match.end()
+            continue
+        separator = _KEY_SEPARATOR_RE.search(text, pos)
+        if separator is None:
+            return
+        pos = separator.end()
+
 
 class ParseStrategy(Enum):
     """JSON解析策略枚举"""
@@ -37,37 +243,39 @@ class OutputValidator:
         """检查值是否有效"""
         if value is None:
             return False
-        str_val = str(value).strip().lower()
-        return str_val not in INVALID_VALUES and len(str_val) > 0
+        str_val = value if isinstance(value, str) else str(value)
+        return str_val.strip().lower() not in INVALID_VALUES
     
     @staticmethod
     def clean_value(value: Any) -> Optional[str]:
         """清理值，移除无效内容"""
         if value is None:
             return None
-        str_val = str(value).strip()
+        str_val = value if isinstance(value, str) else str(value)
         
-        # 移除常见的引号问题
-        str_val = str_val.strip('"\'')
+        # 移除首尾空白和常见的引号问题
+        str_val = str_val.strip().strip('"\'')
         
         # 检查是否为无效值
         if str_val.lower() in INVALID_VALUES:
             return None
         
-        # 检查是否为占位符格式
-        if re.match(r'^<.*>$', str_val) or re.match(r'^\[.*\]$', str_val):
+        # 检查是否为占位符格式：单行的 <...> 或 [...]
+        if len(str_val) >= 2 and (str_val[0], str_val[-1]) in _PLACEHOLDER_BRACKETS and '\n' not in str_val:
             return None
         
         return str_val if str_val else None
     
     @staticmethod
-    def validate_and_correct(data: Dict, expected_attributes: List[str] = None) -> Dict:
+    def validate_and_correct(data: Dict, expected_attributes: List[str] = None,
+                             expected_meta: List[Tuple[str, str, frozenset, float]] = None) -> Dict:
         """
         验证并纠正输出数据，确保符合预期结构
         
         Args:
             data: 解析后的数据
             expected_attributes: 预期的属性名称列表
+            expected_meta: prepare_expected 预先计算的属性元数据，省略时按需计算
         
         Returns:
             验证和纠正后的数据
@@ -75,6 +283,19 @@ class OutputValidator:
         if not isinstance(data, dict):
             return data
         
+        # 快速路径：数据恰好由全部预期属性组成且值均为干净的字符串时直接返回
+        if expected_attributes and len(data) == len(expected_attributes):
+            fast_result = {}
+            for attr in expected_attributes:
+                value = data.get(attr)
+                if (not isinstance(value, str) or attr in _META_KEYS
+                        or OutputValidator.clean_value(value) != value):
+                    break
+                fast_result[attr] = value
+            else:
+                if len(fast_result) == len(data):
+                    return fast_result
+        
         corrected_data = {}
         
         # 处理嵌套的attributes结构
@@ -89,26 +310,49 @@ class OutputValidator:
         
         # 直接的key-value对
         for key, value in data.items():
-            if key not in ['attributes', 'entity_name', 'data_source', '实体名称']:
+            if key not in _META_KEYS:
                 cleaned_value = OutputValidator.clean_value(value)
                 if cleaned_value:
                     corrected_data[key] = cleaned_value
         
         # 如果提供了预期属性，进行模糊匹配和纠正
         if expected_attributes:
-            corrected_data = OutputValidator._fuzzy_match_attributes(corrected_data, expected_attributes)
+            corrected_data = OutputValidator._fuzzy_match_attributes(
+                corrected_data, expected_attributes, expected_meta
+            )
         
         return corrected_data
     
     @staticmethod
-    def _fuzzy_match_attributes(data: Dict, expected_attributes: List[str]) -> Dict:
+    def prepare_expected(expected_attributes: List[str]) -> List[Tuple[str, str, frozenset, float]]:
+        """
+        预先计算模糊匹配所需的属性元数据：(属性名, 小写形式, 关键词集合, 关键词数的倒数)
+        关键词为空的属性倒数记为 0，其关键词重叠度恒为 0
+        """
+        meta = []
+        for attr in expected_attributes or ():
+            lowered = attr.lower()
+            keywords = frozenset(_WORD_RE.findall(lowered))
+            meta.append((attr, lowered, keywords, 1.0 / len(keywords) if keywords else 0.0))
+        return meta
+    
+    @staticmethod
+    def _fuzzy_match_attributes(data: Dict, expected_attributes: List[str],
+                                expected_meta: List[Tuple[str, str, frozenset, float]] = None) -> Dict:
         """
         使用模糊匹配将数据属性映射到预期属性
         """
+        if expected_meta is None:
+            expected_meta = OutputValidator.prepare_expected(expected_attributes)
+        
         result = {}
         used_keys = set()
         
-        for expected_attr in expected_attributes:
+        # 数据键的小写形式和关键词只计算一次
+        lowered_keys = {key: key.lower() for key in data}
+        key_keywords = {key: set(_WORD_RE.findall(lowered)) for key, lowered in lowered_keys.items()}
+        
+        for expected_attr, expected_lower, expected_keywords, inv_keyword_count in expected_meta:
             # 首先尝试精确匹配
             if expected_attr in data:
                 result[expected_attr] = data[expected_attr]
@@ -118,18 +362,25 @@ class OutputValidator:
             # 然后尝试模糊匹配
             best_match = None
             best_score = 0.0
+            expected_len = len(expected_lower)
             
             for key in data.keys():
                 if key in used_keys:
                     continue
                 
-                # 计算相似度
-                score = SequenceMatcher(None, expected_attr.lower(), key.lower()).ratio()
-                
                 # 检查是否包含关键词
-                expected_keywords = set(re.findall(r'\w+', expected_attr.lower()))
-                key_keywords = set(re.findall(r'\w+', key.lower()))
-                keyword_overlap = len(expected_keywords & key_keywords) / max(len(expected_keywords), 1)
+                keyword_overlap = len(expected_keywords & key_keywords[key]) * inv_keyword_count
+                
+                # 相似度上界：公共字符数不超过较短串长度，ratio <= 2*min/(la+lb)；
+                # 上界下的综合得分也无法胜出时跳过相似度计算
+                key_len = len(lowered_keys[key])
+                total_len = expected_len + key_len
+                ratio_bound = 2 * min(expected_len, key_len) / total_len if total_len else 1.0
+                if ratio_bound * 0.6 + keyword_overlap * 0.4 + 1e-9 <= max(best_score, 0.5):
+                    continue
+                
+                # 计算相似度
+                score = _similarity_ratio(expected_lower, lowered_keys[key])
                 
                 combined_score = score * 0.6 + keyword_overlap * 0.4
                 
@@ -149,13 +400,29 @@ class OutputValidator:
         
         return result
 
-class RobustLLMJsonParser:
+
+@functools.lru_cache(maxsize=256)
+def _expected_meta_for(attributes: tuple) -> tuple:
+    """按属性元组缓存 OutputValidator.prepare_expected 的结果，逐次传入相同的预期属性时直接复用"""
+    return tuple(OutputValidator.prepare_expected(attributes))
+
+
+class RobustLLMJsonParser(CachedStateMixin):
     """
     稳定的LLM JSON解析器
     处理各种格式包括markdown代码块、格式错误的JSON等
     增强版：支持输出验证、属性映射、数据纠偏
     """
     
+    # 解析结果缓存容量（按清洗后的文本缓存，命中时跳过全部解析策略）
+    PARSE_CACHE_SIZE = 1024
+    # iter_parse 对超过该长度的JSON数组逐项解码
+    STREAM_MIN_CHARS = 64_000
+    # parse_many 少于该条数时不启动进程池
+    PARALLEL_MIN_TEXTS = 64
+    
+    _TRANSIENT_ATTRS = ('_parse_cached',)
+    
     def __init__(self, expected_attributes: List[str] = None):
         """
         初始化解析器
@@ -163,8 +430,8 @@ class RobustLLMJsonParser:
         Args:
             expected_attributes: 预期的属性名称列表，用于验证和纠偏
         """
-        self.expected_attributes = expected_attributes or []
         self.validator = OutputValidator()
+        self.set_expected_attributes(expected_attributes or [])
         
         # 按优先级排序的解析策略
         self.strategies = [
@@ -175,12 +442,36 @@ class RobustLLMJsonParser:
             self._try_key_value_extract,
             self._try_cleanup_and_parse,
         ]
+        self._full_order = tuple(range(len(self.strategies)))
+        # 不含 { / [ 的文本只可能被直接解析（JSON标量）或 key-value 提取成功，其余策略不必运行
+        self._bracketless_order = tuple(
+            i for i, strategy in enumerate(self.strategies)
+            if strategy in (self._try_direct_parse, self._try_key_value_extract)
+        )
+        
+        self._init_caches()
+    
+    def _init_caches(self):
+        # 缓存规范化后的JSON字符串而非对象本身，每次命中都重新解析出新对象，调用方修改结果不会污染缓存
+        self._parse_cached = functools.lru_cache(maxsize=self.PARSE_CACHE_SIZE)(self._parse_with_strategies)
+    
+    def clear_cache(self):
+        """清空解析结果缓存"""
+        self._parse_cached.cache_clear()
     
     def set_expected_attributes(self, attributes: List[str]):
-        """设置预期属性列表"""
+        """设置预期属性列表，并预先计算模糊匹配用的属性元数据"""
         self.expected_attributes = attributes
+        self._expected_meta = _expected_meta_for(tuple(attributes))
+    
+    def _resolve_expected(self, expected_attributes: Optional[List[str]]) -> Tuple[List[str], tuple]:
+        """确定本次调用使用的预期属性及其元数据：优先使用调用参数，不修改实例状态"""
+        if expected_attributes:
+            return expected_attributes, _expected_meta_for(tuple(expected_attributes))
+        return self.expected_attributes, self._expected_meta
     
-    def parse(self, text: str, default_value: Any = None, validate: bool = True) -> Union[Dict, List, Any]:
+    def parse(self, text: str, default_value: Any = None, validate: bool = True,
+              expected_attributes: List[str] = None) -> Union[Dict, List, Any]:
         """
         使用多种策略将LLM输出字符串解析为JSON
         
@@ -188,6 +479,7 @@ class RobustLLMJsonParser:
             text: LLM的原始字符串输出
             default_value: 解析失败时返回的默认值
             validate: 是否进行输出验证和纠偏
+            expected_attributes: 本次调用的预期属性列表，省略时使用实例上设置的预期属性
         
         Returns:
             解析后的JSON对象（dict、list或其他JSON可序列化类型）
@@ -200,27 +492,33 @@ class RobustLLMJsonParser:
                 return default_value
             raise ValueError("输入字符串为空")
         
+        attributes, expected_meta = self._resolve_expected(expected_attributes)
         cleaned_output = text.strip()
         
-        # 尝试每种解析策略
-        for strategy in self.strategies:
+        # 以 { / [ 开头时先按干净的JSON直接解析，成功则跳过策略链和缓存
+        result = None
+        if cleaned_output[0] in '{[':
             try:
-                result = strategy(cleaned_output)
-                if result is not None:
-                    logger.debug(f"成功使用策略解析: {strategy.__name__}")
-                    
-                    # 进行输出验证和纠偏
-                    if validate and isinstance(result, dict):
-                        result = self.validator.validate_and_correct(result, self.expected_attributes)
-                    
-                    return result
-            except Exception as e:
-                logger.debug(f"策略 {strategy.__name__} 失败: {str(e)}")
-                continue
+                result = json_loads(cleaned_output)
+            except json.JSONDecodeError:
+                pass
+        
+        # 尝试每种解析策略（结果按文本缓存）
+        if result is None:
+            cached = self._parse_cached(cleaned_output)
+            if cached is not None:
+                result = json_loads(cached)
+        
+        if result is not None:
+            # 进行输出验证和纠偏
+            if validate and isinstance(result, dict):
+                result = self.validator.validate_and_correct(result, attributes, expected_meta)
+            
+            return result
         
         # 如果所有策略都失败，尝试从文本中提取关键信息
-        if self.expected_attributes:
-            extracted = self._extract_from_text(cleaned_output)
+        if attributes:
+            extracted = self._extract_from_text(cleaned_output, attributes)
             if extracted:
                 logger.warning("使用文本提取策略")
                 return extracted
@@ -232,62 +530,152 @@ class RobustLLMJsonParser:
         
         raise ValueError(f"无法从LLM输出解析JSON: {text[:500]}...")
     
+    def iter_parse(self, text: str, validate: bool = True,
+                   expected_attributes: List[str] = None) -> Iterator[Any]:
+        """
+        逐项解析LLM输出的JSON数组，用于批量实体抽取等超大响应
+        
+        文本超过 STREAM_MIN_CHARS 且以 [ 开头时逐个解码数组元素，不构建完整的结果列表；
+        其他情况或第一个元素即解析失败时回退到 parse，结果为列表时逐项产出，否则整体产出一次。
+        数组中途出现格式错误时记录警告并停止。
+        
+        Args:
+            text: LLM的原始字符串输出
+            validate: 是否对dict元素进行输出验证和纠偏
+            expected_attributes: 本次调用的预期属性列表，省略时使用实例上设置的预期属性
+        
+        Yields:
+            数组元素
+        
+        Raises:
+            ValueError: 回退到 parse 后仍无法解析
+        """
+        stripped = text.strip() if text else ''
+        if len(stripped) > self.STREAM_MIN_CHARS and stripped.startswith('['):
+            attributes, expected_meta = self._resolve_expected(expected_attributes)
+            count = 0
+            try:
+                for item in _iter_array_items(stripped):
+                    if validate and isinstance(item, dict):
+                        item = self.validator.validate_and_correct(item, attributes, expected_meta)
+                    count += 1
+                    yield item
+                return
+            except json.JSONDecodeError as e:
+                if count:
+                    logger.warning(f"JSON数组第 {count + 1} 个元素解析失败，停止流式解析: {e}")
+                    return
+                logger.debug(f"流式解析失败，回退到完整解析: {e}")
+        
+        result = self.parse(text, validate=validate, expected_attributes=expected_attributes)
+        if isinstance(result, list):
+            yield from result
+        else:
+            yield result
+    
+    def parse_many(self, texts: List[str], default_value: Any = None, validate: bool = True,
+                   expected_attributes: List[str] = None, n_jobs: int = 1) -> List[Any]:
+        """
+        批量解析多条LLM输出，结果与输入顺序一致
+        
+        与逐条调用 parse 不同，单条解析失败时不抛出异常，该位置返回 default_value。
+        
+        Args:
+            texts: LLM的原始字符串输出列表
+            default_value: 解析失败时返回的默认值
+            validate: 是否进行输出验证和纠偏
+            expected_attributes: 本批次的预期属性列表，省略时使用实例上设置的预期属性
+            n_jobs: 并行进程数，1 为单进程，-1 使用全部CPU核心；少于 PARALLEL_MIN_TEXTS 条时总是单进程
+        """
+        parse_chunk = functools.partial(
+            self._parse_chunk, default_value=default_value, validate=validate,
+            expected_attributes=expected_attributes
+        )
+        return run_chunked(parse_chunk, list(texts), n_jobs, self.PARALLEL_MIN_TEXTS)
+    
+    def _parse_chunk(self, texts: List[str], default_value: Any = None, validate: bool = True,
+                     expected_attributes: List[str] = None) -> List[Any]:
+        """顺序解析一块文本，失败的位置返回 default_value"""
+        results = []
+        for text in texts:
+            try:
+                results.append(self.parse(text, default_value, validate, expected_attributes))
+            except ValueError as e:
+                logger.debug(f"批量解析中单条解析失败: {e}")
+                results.append(default_value)
+        return results
+    
+    def _parse_with_strategies(self, text: str) -> Optional[str]:
+        """
+        依次尝试各解析策略
+        
+        Returns:
+            首个成功策略结果的JSON字符串；全部失败时返回None
+        """
+        # 各策略对同一文本可能给出不同结果，始终按固定优先级尝试，结果只取决于文本本身
+        order = self._full_order if '{' in text or '[' in text else self._bracketless_order
+        for idx in order:
+            strategy = self.strategies[idx]
+            try:
+                result = strategy(text)
+                if result is not None:
+                    logger.debug(f"成功使用策略解析: {strategy.__name__}")
+                    return json.dumps(result, ensure_ascii=False)
+            except Exception as e:
+                logger.debug(f"策略 {strategy.__name__} 失败: {str(e)}")
+                continue
+        
+        return None
+    
     def _try_direct_parse(self, text: str) -> Optional[Any]:
         """尝试直接将文本解析为JSON"""
-        return json.loads(text)
+        return json_loads(text)
     
     def _try_markdown_block_parse(self, text: str) -> Optional[Any]:
         """从markdown代码块中提取并解析JSON"""
-        patterns = [
-            r'```json\s*\n?(.*?)\n?```',
-            r'```\s*\n?(.*?)\n?```',
-            r'`([^`]+)`',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.DOTALL | re.IGNORECASE)
-            for match in matches:
+        # 逐个惰性匹配，非 { / [ 开头的片段（如行内代码）直接跳过，成功即返回
+        for pattern in _MD_BLOCK_PATTERNS:
+            for match in pattern.finditer(text):
+                clean_match = match.group(1).strip()
+                if not clean_match or clean_match[0] not in '{[':
+                    continue
                 try:
-                    clean_match = match.strip()
-                    if clean_match.startswith('{') or clean_match.startswith('['):
-                        return json.loads(clean_match)
+                    return json_loads(clean_match)
                 except json.JSONDecodeError:
                     continue
         
         return None
     
     def _try_nested_json_extract(self, text: str) -> Optional[Any]:
-        """提取嵌套的JSON结构"""
-        # 查找最外层的完整JSON对象
-        depth = 0
-        start_idx = -1
-        
-        for i, char in enumerate(text):
-            if char == '{':
-                if depth == 0:
-                    start_idx = i
-                depth += 1
-            elif char == '}':
-                depth -= 1
-                if depth == 0 and start_idx >= 0:
-                    potential_json = text[start_idx:i+1]
-                    try:
-                        return json.loads(potential_json)
-                    except json.JSONDecodeError:
-                        # 继续查找下一个JSON对象
-                        start_idx = -1
+        """提取嵌套的JSON结构：按出现顺序返回第一个可解析的最外层JSON对象"""
+        found_empty = False
+        for candidate in _iter_json_candidates(text, '{'):
+            # 最短的非空对象为 {"":0}，更短的片段只可能是空对象或无效内容，不必解析
+            if len(candidate) < 6:
+                found_empty = found_empty or not candidate[1:-1].strip()
+                continue
+            try:
+                return json_loads(candidate)
+            except json.JSONDecodeError:
+                # 继续查找下一个JSON对象
+                continue
         
-        return None
+        # 没有可解析的非空对象时退回空对象
+        return {} if found_empty else None
     
     def _try_regex_extract(self, text: str) -> Optional[Any]:
-        """使用正则表达式模式提取JSON"""
-        # 更复杂的JSON对象匹配
-        json_object_pattern = r'\{(?:[^{}]|(?:\{(?:[^{}]|\{[^{}]*\})*\}))*\}'
-        
-        matches = re.findall(json_object_pattern, text, re.DOTALL)
-        for match in sorted(matches, key=len, reverse=True):  # 优先尝试最长的匹配
+        """扫描括号配平的JSON片段并尝试解析（支持任意嵌套层数，无正则回溯）"""
+        # 同时收集数组/对象片段和仅按花括号配平的对象片段，残缺数组中的对象也能被找到
+        # 文本中没有方括号时两种扫描结果相同，只扫描一次
+        candidates = dict.fromkeys(_iter_json_candidates(text))
+        if '[' in text or ']' in text:
+            candidates.update(dict.fromkeys(_iter_json_candidates(text, '{')))
+        # 最外层片段互不重叠，总长度不超过文本长度，排序开销只与片段个数有关
+        if len(candidates) > 1:
+            candidates = sorted(candidates, key=len, reverse=True)
+        for candidate in candidates:  # 优先尝试最长的片段
             try:
-                return json.loads(match.strip())
+                return json_loads(candidate)
             except json.JSONDecodeError:
                 continue
         
@@ -295,44 +683,36 @@ class RobustLLMJsonParser:
     
     def _try_key_value_extract(self, text: str) -> Optional[Dict]:
         """从文本中提取key-value对"""
-        result = {}
-        
-        # 匹配各种key-value格式
-        patterns = [
-            r'"([^"]+)"\s*:\s*"([^"]*)"',  # "key": "value"
-            r"'([^']+)'\s*:\s*'([^']*)'",  # 'key': 'value'
-            r'"([^"]+)"\s*:\s*(\d+(?:\.\d+)?)',  # "key": number
-            r'([^:\n]+?):\s*([^\n,}]+)',  # key: value (简单格式)
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            for key, value in matches:
-                key = key.strip()
-                value = value.strip().strip('"\'')
-                if key and value and key not in ['', 'name', 'value']:
-                    result[key] = value
+        # 先匹配结构化的key-value格式，都没有结果时再退回宽松格式
+        result = self._collect_key_values(
+            pair for pattern in _KEY_VALUE_PATTERNS for pair in pattern.findall(text)
+        )
+        if not result:
+            result = self._collect_key_values(_iter_loose_key_values(text))
         
         return result if result else None
     
+    @staticmethod
+    def _collect_key_values(pairs) -> Dict:
+        """清理并收集key-value对"""
+        result = {}
+        for key, value in pairs:
+            key = key.strip()
+            value = value.strip().strip('"\'')
+            if key and value and key not in ('name', 'value'):
+                result[key] = value
+        return result
+    
     def _try_cleanup_and_parse(self, text: str) -> Optional[Any]:
         """清理并尝试解析JSON"""
-        cleaned = text
-        
         # 移除markdown标记
-        cleaned = re.sub(r'```json\s*\n?', '', cleaned)
-        cleaned = re.sub(r'\n?```', '', cleaned)
-        
-        # 移除常见的前导文字
-        prefixes_to_remove = [
-            r'^[^{]*?(?=\{)',  # 移除 { 之前的所有内容
-            r'以下是.*?[：:]\s*',
-            r'返回.*?[：:]\s*',
-            r'结果.*?[：:]\s*',
-            r'JSON.*?[：:]\s*',
-        ]
-        for pattern in prefixes_to_remove:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE | re.DOTALL)
+        cleaned = _MD_FENCE_RE.sub('', text)
+        
+        # 移除 { 之前的所有内容和常见的前导文字
+        brace_idx = cleaned.find('{')
+        if brace_idx > 0:
+            cleaned = cleaned[brace_idx:]
+        cleaned = _sub_before_last(_PREFIX_STRIP_RE, '', cleaned, ':：')
         
         # 移除多余的空白
         cleaned = cleaned.strip()
@@ -350,26 +730,25 @@ class RobustLLMJsonParser:
         fixed_json = self._fix_json_formatting(potential_json)
         
         try:
-            return json.loads(fixed_json)
+            return json_loads(fixed_json)
         except json.JSONDecodeError:
             # 尝试更aggressive的修复
             aggressive_fix = self._aggressive_json_fix(fixed_json)
             try:
-                return json.loads(aggressive_fix)
+                return json_loads(aggressive_fix)
             except json.JSONDecodeError:
                 return None
     
     def _fix_json_formatting(self, text: str) -> str:
         """修复常见的JSON格式问题"""
-        # 移除尾随逗号
-        text = re.sub(r',(\s*[}\]])', r'\1', text)
-        
-        # 修复缺少引号的key
-        text = re.sub(r'(\{|\,)\s*([a-zA-Z_\u4e00-\u9fa5][a-zA-Z0-9_\u4e00-\u9fa5]*)\s*:', r'\1"\2":', text)
+        # 修复中文引号（一次查表替换）
+        text = text.translate(_QUOTE_TAB)
         
-        # 修复中文引号
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace(''', "'").replace(''', "'")
+        # 移除尾随逗号、修复缺少引号的key；先用 in 判断是否可能存在匹配，不可能时不启动正则
+        if ',' in text:
+            text = _TRAILING_COMMA_RE.sub(r'\1', text)
+        if ':' in text:
+            text = _UNQUOTED_KEY_RE.sub(r'\1"\2":', text)
         
         # 修复单引号为双引号（仅在JSON上下文中）
         # 这个需要小心处理，避免破坏字符串内容
@@ -379,41 +758,43 @@ class RobustLLMJsonParser:
     def _aggressive_json_fix(self, text: str) -> str:
         """更激进的JSON修复"""
         # 移除控制字符
-        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
+        text = _CTRL_CHARS_RE.sub('', text)
         
         # 修复换行符在字符串中
-        text = re.sub(r'("(?:[^"\\]|\\.)*")', lambda m: m.group(1).replace('\n', '\\n'), text)
+        text = _JSON_STRING_RE.sub(lambda m: m.group(1).replace('\n', '\\n'), text)
         
         # 移除注释
-        text = re.sub(r'//.*?\n', '\n', text)
-        text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
+        text = _sub_before_last(_LINE_COMMENT_RE, '\n', text, '\n')
+        text = _BLOCK_COMMENT_RE.sub('', text)
         
         # 修复重复的引号
-        text = re.sub(r'""([^"]+)""', r'"\1"', text)
+        text = _DOUBLED_QUOTES_RE.sub(r'"\1"', text)
         
         # 修复缺失的逗号
-        text = re.sub(r'"\s*\n\s*"', '",\n"', text)
+        text = _MISSING_COMMA_RE.sub('",\n"', text)
         
         return text
     
-    def _extract_from_text(self, text: str) -> Optional[Dict]:
+    def _extract_from_text(self, text: str, expected_attributes: List[str] = None) -> Optional[Dict]:
         """从自然语言文本中提取属性值"""
-        if not self.expected_attributes:
+        if expected_attributes is None:
+            expected_attributes = self.expected_attributes
+        if not expected_attributes:
             return None
         
         result = {}
         
-        for attr in self.expected_attributes:
-            # 构建匹配模式 - 更严格的匹配
-            attr_patterns = [
-                rf'{re.escape(attr)}\s*[：:]\s*["\']?([^"\'\n,}}]+)["\']?',
-                rf'["\']?{re.escape(attr)}["\']?\s*[：:]\s*["\']?([^"\'\n,}}]+)["\']?',
-                rf'{re.escape(attr)}\s*为\s*["\']?([^"\'\n,}}]+)["\']?',
-                rf'{re.escape(attr)}\s*是\s*["\']?([^"\'\n,}}]+)["\']?',
-            ]
-            
-            for pattern in attr_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+        for attr in expected_attributes:
+            # 匹配模式 - 更严格的匹配（按属性名缓存编译结果）
+            probe, patterns = _attr_patterns(attr)
+            # 一次扫描定位属性名首次出现的位置：不出现则跳过全部模式，
+            # 出现时从该位置（留出属性名前可选的引号）开始匹配
+            found = probe.search(text)
+            if found is None:
+                continue
+            start = max(found.start() - 1, 0)
+            for pattern in patterns:
+                match = pattern.search(text, start)
                 if match:
                     value = match.group(1).strip()
                     cleaned = OutputValidator.clean_value(value)
@@ -439,6 +820,5 @@ def parse_llm_json(text: str, default_value: Any = None, expected_attributes: Li
     Returns:
         解析后的JSON对象
     """
-    if expected_attributes:
-        json_parser.set_expected_attributes(expected_attributes)
-    return json_parser.parse(text, default_value)
\ No newline at end of file
+    # 预期属性按调用传入，不修改全局解析器的状态，多线程并发调用互不影响
+    return json_parser.parse(text, default_value, expected_attributes=expected_attributes)
\ No newline at end of file
@@ -7,9 +7,11 @@
 
 import os
 import json
+import base64
 import hashlib
 import logging
 import time
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
@@ -19,8 +21,102 @@ from enum import Enum
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+try:
+    import pyarrow
+    import pyarrow.feather
+except ImportError:
+    pyarrow = None
+
 logger = logging.getLogger(__name__)
 
+# 状态和检查点文件格式：安装 msgspec 时写 msgpack，否则写 JSON；读取时两种格式都支持
+STATE_SUFFIX = '.msgpack' if msgspec is not None else '.json'
+_STATE_SUFFIXES = (STATE_SUFFIX, '.json' if msgspec is not None else '.msgpack')
+
+
+def _json_default(obj):
+    # JSON 不支持二进制数据（如已处理行的位图），按 base64 文本保存
+    if isinstance(obj, (bytes, bytearray)):
+        return {'__base64__': base64.b64encode(obj).decode('ascii')}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_object_hook(obj: Dict[str, Any]):
+    if len(obj) == 1 and '__base64__' in obj:
+        return base64.b64decode(obj['__base64__'])
+    return obj
+
+
+def _encode_state(data: Dict[str, Any], indent: Optional[int] = 2) -> bytes:
+    """序列化状态数据（indent 仅对 JSON 格式有效）"""
+    if msgspec is not None:
+        return msgspec.msgpack.encode(data)
+    return json.dumps(data, ensure_ascii=False, indent=indent, default=_json_default).encode('utf-8')
+
+
+def _decode_state(raw: bytes) -> Dict[str, Any]:
+    """反序列化状态数据，按首字节区分 JSON（以 { 开头）与 msgpack（映射首字节为 0x80-0x8f / 0xde / 0xdf）"""
+    if raw.lstrip()[:1] == b'{':
+        return json.loads(raw.decode('utf-8'), object_hook=_json_object_hook)
+    if msgspec is None:
+        raise ValueError("读取 msgpack 格式的状态文件需要安装 msgspec")
+    return msgspec.msgpack.decode(raw)
+
+
+# 流程内部中间 DataFrame 文件的格式：安装 pyarrow 时用 Feather（列式存储，读取无需逐字段解析），否则 CSV
+INTERMEDIATE_SUFFIX = '.feather' if pyarrow is not None else '.csv'
+
+
+def _read_df(path, memory_map: bool = False) -> pd.DataFrame:
+    """
+    按扩展名读取 DataFrame：.feather / .parquet 用 Arrow 读取，其余按带BOM的UTF-8 CSV读取。
+    memory_map 为 True 时以内存映射方式打开 Feather 文件并零拷贝转换：对以 memory_mappable=True 写出的文件，
+    无空值的数值列和字符串列直接引用映射的页面（只读），不复制到堆内存；其余列照常转换。
+    返回的 DataFrame 存活期间文件保持映射
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == '.feather':
+        if memory_map:
+            # split_blocks 避免合并为二维块时复制，self_destruct 转换完一列即释放对应的 Arrow 缓冲
+            table = pyarrow.feather.read_table(str(path), memory_map=True)
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+        return pd.read_feather(path)
+    if suffix == '.parquet':
+        return pd.read_parquet(path)
+    return pd.read_csv(path, encoding='utf-8-sig')
+
+
+def _write_df(df: pd.DataFrame, path, memory_mappable: bool = False) -> Path:
+    """
+    按扩展名写出 DataFrame（不保存索引），返回实际写入的路径。
+    Feather / Parquet 需要 pyarrow，列内类型混杂时 Arrow 也无法转换，这两种情况改写同名的 .csv 文件。
+    memory_mappable 为 True 时 Feather 不压缩并写成单个记录批，_read_df(memory_map=True) 可零拷贝读取；
+    否则使用 pyarrow 默认压缩和分批大小
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in ('.feather', '.parquet'):
+        if pyarrow is not None:
+            try:
+                if suffix == '.feather' and memory_mappable:
+                    # 多个记录批转换时必须拼接（复制），单个记录批才能直接引用映射的页面
+                    df.reset_index(drop=True).to_feather(path, compression='uncompressed', chunksize=max(len(df), 1))
+                elif suffix == '.feather':
+                    df.reset_index(drop=True).to_feather(path)
+                else:
+                    df.to_parquet(path, index=False, compression='zstd')
+                return path
+            except pyarrow.ArrowException as e:
+                logger.warning(f"Cannot write {path.name} with Arrow ({e}), falling back to CSV")
+                path.unlink(missing_ok=True)
+        path = path.with_suffix('.csv')
+    df.to_csv(path, index=False, encoding='utf-8-sig')
+    return path
+
 
 class StageStatus(Enum):
     """流程阶段状态"""
@@ -104,50 +200,88 @@ class CheckpointManager:
     
     def save_checkpoint(self, stage_name: str, data: Dict[str, Any]):
         """保存检查点"""
+        data['timestamp'] = datetime.now().isoformat()
+        # 锁外完成编码（processed_indices 可能很长），锁内只写入字节；JSON 格式不缩进
+        payload = _encode_state(data, indent=None)
         with self._lock:
-            checkpoint_file = self.checkpoint_dir / f"{stage_name}_checkpoint.json"
-            data['timestamp'] = datetime.now().isoformat()
-            with open(checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            checkpoint_file = self.checkpoint_dir / f"{stage_name}_checkpoint{STATE_SUFFIX}"
+            checkpoint_file.write_bytes(payload)
             logger.debug(f"Checkpoint saved for {stage_name}")
     
     def load_checkpoint(self, stage_name: str) -> Optional[Dict[str, Any]]:
-        """加载检查点"""
-        checkpoint_file = self.checkpoint_dir / f"{stage_name}_checkpoint.json"
-        if checkpoint_file.exists():
-            with open(checkpoint_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        """加载检查点（优先当前格式，其次另一种格式的旧文件）"""
+        for suffix in _STATE_SUFFIXES:
+            checkpoint_file = self.checkpoint_dir / f"{stage_name}_checkpoint{suffix}"
+            if checkpoint_file.exists():
+                return _decode_state(checkpoint_file.read_bytes())
         return None
     
     def clear_checkpoint(self, stage_name: str):
         """清除检查点"""
-        checkpoint_file = self.checkpoint_dir / f"{stage_name}_checkpoint.json"
-        if checkpoint_file.exists():
-            checkpoint_file.unlink()
-            logger.debug(f"Checkpoint cleared for {stage_name}")
+        for suffix in _STATE_SUFFIXES:
+            checkpoint_file = self.checkpoint_dir / f"{stage_name}_checkpoint{suffix}"
+            if checkpoint_file.exists():
+                checkpoint_file.unlink()
+                logger.debug(f"Checkpoint cleared for {stage_name}")
+    
+    @staticmethod
+    def pack_processed(done: np.ndarray) -> bytes:
+        """将已处理行的布尔掩码压缩为位图（每行 1 bit）"""
+        return np.packbits(done).tobytes()
+    
+    @staticmethod
+    def processed_mask(checkpoint: Optional[Dict[str, Any]], total_rows: int) -> np.ndarray:
+        """从检查点还原已处理行的布尔掩码，兼容旧格式的 processed_indices 列表"""
+        done = np.zeros(total_rows, dtype=bool)
+        if not checkpoint:
+            return done
+        if checkpoint.get('done_bits') is not None:
+            bits = np.unpackbits(np.frombuffer(checkpoint['done_bits'], dtype=np.uint8))
+            count = min(total_rows, len(bits), checkpoint.get('total_rows', total_rows))
+            done[:count] = bits[:count].astype(bool)
+        elif checkpoint.get('processed_indices'):
+            indices = np.asarray(checkpoint['processed_indices'], dtype=np.intp)
+            done[indices[(indices >= 0) & (indices < total_rows)]] = True
+        return done
     
     def save_dataframe_checkpoint(self, stage_name: str, df: pd.DataFrame, 
                                    processed_indices: List[int], metadata: Dict = None):
         """保存 DataFrame 处理进度检查点"""
+        done = np.zeros(len(df), dtype=bool)
+        done[np.asarray(processed_indices, dtype=np.intp)] = True
         checkpoint_data = {
-            'processed_indices': processed_indices,
+            'done_bits': self.pack_processed(done),
             'total_rows': len(df),
             'metadata': metadata or {}
         }
-        # 保存已处理的数据
-        partial_file = self.checkpoint_dir / f"{stage_name}_partial.csv"
+        # 保存已处理的数据；写入格式回退时删除另一种格式的旧文件，避免恢复时读到过期数据
         if len(processed_indices) > 0:
-            df.iloc[processed_indices].to_csv(partial_file, index=False, encoding='utf-8-sig')
+            # 恢复时零拷贝内存映射读取。先写临时文件再替换，不截断可能仍被映射的旧文件
+            temp_file = _write_df(df.iloc[processed_indices],
+                                  self.checkpoint_dir / f"{stage_name}_partial.tmp{INTERMEDIATE_SUFFIX}",
+                                  memory_mappable=True)
+            partial_file = temp_file.with_name(f"{stage_name}_partial{temp_file.suffix}")
+            os.replace(temp_file, partial_file)
+            for suffix in (INTERMEDIATE_SUFFIX, '.csv'):
+                stale_file = self.checkpoint_dir / f"{stage_name}_partial{suffix}"
+                if stale_file != partial_file:
+                    stale_file.unlink(missing_ok=True)
         
         self.save_checkpoint(stage_name, checkpoint_data)
     
     def load_dataframe_checkpoint(self, stage_name: str) -> Optional[Dict]:
-        """加载 DataFrame 处理进度"""
+        """
+        加载 DataFrame 处理进度
+        
+        Feather 格式的 partial_df 零拷贝映射自检查点文件，其中映射的列为只读，需要修改时先 copy()
+        """
         checkpoint = self.load_checkpoint(stage_name)
         if checkpoint:
-            partial_file = self.checkpoint_dir / f"{stage_name}_partial.csv"
-            if partial_file.exists():
-                checkpoint['partial_df'] = pd.read_csv(partial_file, encoding='utf-8-sig')
+            for suffix in dict.fromkeys((INTERMEDIATE_SUFFIX, '.csv')):
+                partial_file = self.checkpoint_dir / f"{stage_name}_partial{suffix}"
+                if partial_file.exists():
+                    checkpoint['partial_df'] = _read_df(partial_file, memory_map=True)
+                    break
             return checkpoint
         return None
 
@@ -243,13 +377,13 @@ class PipelineManager:
         return pipeline_id
     
     def load_pipeline(self, pipeline_id: str) -> bool:
-        """加载已存在的流程状态"""
-        state_file = self.state_dir / f"{pipeline_id}.json"
-        if state_file.exists():
-            with open(state_file, 'r', encoding='utf-8') as f:
-                self.state = PipelineState.from_dict(json.load(f))
-            logger.info(f"Loaded pipeline: {pipeline_id}")
-            return True
+        """加载已存在的流程状态（优先当前格式，其次另一种格式的旧文件）"""
+        for suffix in _STATE_SUFFIXES:
+            state_file = self.state_dir / f"{pipeline_id}{suffix}"
+            if state_file.exists():
+                self.state = PipelineState.from_dict(_decode_state(state_file.read_bytes()))
+                logger.info(f"Loaded pipeline: {pipeline_id}")
+                return True
         return False
     
     def _save_state(self):
@@ -257,9 +391,8 @@ class PipelineManager:
         if self.state:
             with self._lock:
                 self.state.updated_at = datetime.now().isoformat()
-                state_file = self.state_dir / f"{self.state.pipeline_id}.json"
-                with open(state_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.state.to_dict(), f, ensure_ascii=False, indent=2)
+                state_file = self.state_dir / f"{self.state.pipeline_id}{STATE_SUFFIX}"
+                state_file.write_bytes(_encode_state(self.state.to_dict()))
     
     def run_stage(self, stage_name: str, input_data: Any = None, 
                   resume: bool = True) -> Optional[Any]:
@@ -357,7 +490,7 @@ class PipelineManager:
                 logger.info(f"Skipping completed stage: {stage_name}")
                 # 尝试加载上一阶段的输出作为下一阶段的输入
                 if stage_result.output_file and Path(stage_result.output_file).exists():
-                    input_data = pd.read_csv(stage_result.output_file, encoding='utf-8-sig')
+                    input_data = _read_df(stage_result.output_file)
                 continue
             
             try:
@@ -398,20 +531,21 @@ class PipelineManager:
     
     def list_pipelines(self) -> List[Dict]:
         """列出所有流程"""
-        pipelines = []
-        for state_file in self.state_dir.glob("pipeline_*.json"):
-            try:
-                with open(state_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    pipelines.append({
+        pipelines = {}
+        # 同一流程同时存在两种格式的文件时，以当前格式（先遍历）为准
+        for suffix in _STATE_SUFFIXES:
+            for state_file in self.state_dir.glob(f"pipeline_*{suffix}"):
+                try:
+                    data = _decode_state(state_file.read_bytes())
+                    pipelines.setdefault(data['pipeline_id'], {
                         'pipeline_id': data['pipeline_id'],
                         'created_at': data['created_at'],
                         'updated_at': data['updated_at'],
                         'current_stage': data.get('current_stage')
                     })
-            except:
-                pass
-        return sorted(pipelines, key=lambda x: x['created_at'], reverse=True)
+                except:
+                    pass
+        return sorted(pipelines.values(), key=lambda x: x['created_at'], reverse=True)
 
 
 class BatchProcessor:
@@ -449,28 +583,29 @@ class BatchProcessor:
         self._stop_flag = False
         total_rows = len(df)
         
-        # 确定已处理的行
-        processed_indices = set()
+        # 确定已处理的行（布尔掩码，检查点中以位图保存）
+        done = self.checkpoint_manager.processed_mask(checkpoint, total_rows)
+        processed_count = int(done.sum())
         if checkpoint:
-            processed_indices = set(checkpoint.get('processed_indices', []))
-            logger.info(f"Resuming from checkpoint: {len(processed_indices)}/{total_rows} rows already processed")
+            logger.info(f"Resuming from checkpoint: {processed_count}/{total_rows} rows already processed")
         
         # 确定待处理的行
-        pending_indices = [i for i in range(total_rows) if i not in processed_indices]
+        pending_indices = np.flatnonzero(~done).tolist()
         
         # 分批处理
         results = {}
         batch_count = 0
         
-        for batch_start in range(0, len(pending_indices), self.batch_size):
-            if self._stop_flag:
-                logger.info("Processing stopped by user request")
-                break
-            
-            batch_indices = pending_indices[batch_start:batch_start + self.batch_size]
-            
-            # 并行处理批次
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        # 整个处理过程共用一个线程池，避免每批创建和销毁线程
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=stage_name) as executor:
+            for batch_start in range(0, len(pending_indices), self.batch_size):
+                if self._stop_flag:
+                    logger.info("Processing stopped by user request")
+                    break
+                
+                batch_indices = pending_indices[batch_start:batch_start + self.batch_size]
+                
+                # 并行处理批次
                 futures = {
                     executor.submit(process_row, df.iloc[idx]): idx 
                     for idx in batch_indices
@@ -482,22 +617,23 @@ class BatchProcessor:
                         result = future.result()
                         if result:
                             results[idx] = result
-                        processed_indices.add(idx)
+                        done[idx] = True
+                        processed_count += 1
                     except Exception as e:
                         logger.warning(f"Error processing row {idx}: {e}")
                     
                     # 进度回调
                     if progress_callback:
-                        progress_callback(len(processed_indices), total_rows)
-            
-            batch_count += 1
-            
-            # 每处理几批保存一次检查点
-            if batch_count % 5 == 0:
-                self.checkpoint_manager.save_checkpoint(stage_name, {
-                    'processed_indices': list(processed_indices),
-                    'total_rows': total_rows
-                })
+                        progress_callback(processed_count, total_rows)
+                
+                batch_count += 1
+                
+                # 每处理几批保存一次检查点
+                if batch_count % 5 == 0:
+                    self.checkpoint_manager.save_checkpoint(stage_name, {
+                        'done_bits': self.checkpoint_manager.pack_processed(done),
+                        'total_rows': total_rows
+                    })
         
         # 应用结果到 DataFrame
         for idx, row_data in results.items():
@@ -509,7 +645,7 @@ class BatchProcessor:
         
         # 最终保存检查点
         self.checkpoint_manager.save_checkpoint(stage_name, {
-            'processed_indices': list(processed_indices),
+            'done_bits': self.checkpoint_manager.pack_processed(done),
             'total_rows': total_rows,
             'completed': not self._stop_flag
         })
@@ -539,7 +675,7 @@ def data_cleaning_handler(input_data, config, checkpoint_manager, checkpoint, pr
     
     progress_cb(total, total)
     
-    return pd.read_csv(output_file, encoding='utf-8-sig')
+    return _read_df(output_file)
 
 
 def data_enrichment_handler(input_data, config, checkpoint_manager, checkpoint, progress_cb):
@@ -578,7 +714,7 @@ def data_enrichment_handler(input_data, config, checkpoint_manager, checkpoint,
         df = input_data
     else:
         input_file = enrichment_config.get('input_file')
-        df = pd.read_csv(input_file, encoding='utf-8-sig')
+        df = _read_df(input_file)
     
     name_col = enrichment_config.get('name_column', '品名')
     if name_col not in df.columns:
@@ -602,7 +738,7 @@ def data_enrichment_handler(input_data, config, checkpoint_manager, checkpoint,
     output_file = enrichment_config.get('output_file')
     if output_file:
         Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-        result_df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        _write_df(result_df, output_file)
     
     return result_df
 
@@ -616,11 +752,11 @@ def post_processing_handler(input_data, config, checkpoint_manager, checkpoint,
     
     processor = EntityProcessor(base_path)
     
-    # 如果有输入数据，保存到临时文件供处理器使用
+    # 如果有输入数据，保存到临时文件供处理器使用（处理器按 *.csv 扫描输入目录，必须保持CSV）
     if isinstance(input_data, pd.DataFrame):
         input_file = Path(base_path) / "已补全文件" / "temp_input.csv"
         input_file.parent.mkdir(parents=True, exist_ok=True)
-        input_data.to_csv(input_file, index=False, encoding='utf-8-sig')
+        _write_df(input_data, input_file)
     
     # 执行处理
     # 这里需要根据 EntityProcessor 的具体实现调整
@@ -630,7 +766,7 @@ def post_processing_handler(input_data, config, checkpoint_manager, checkpoint,
     output_file = output_dir / "final_data.csv"
     
     if output_file.exists():
-        return pd.read_csv(output_file, encoding='utf-8-sig')
+        return _read_df(output_file)
     return input_data
 
 
@@ -647,10 +783,9 @@ def graph_construction_handler(input_data, config, checkpoint_manager, checkpoin
     
     # 如果有输入数据
     if isinstance(input_data, pd.DataFrame):
-        input_file = Path(output_dir) / "temp_input.csv"
+        input_file = Path(output_dir) / f"temp_input{INTERMEDIATE_SUFFIX}"
         input_file.parent.mkdir(parents=True, exist_ok=True)
-        input_data.to_csv(input_file, index=False, encoding='utf-8-sig')
-        input_path = str(input_file)
+        input_path = str(_write_df(input_data, input_file))
     else:
         input_path = graph_config.get('input_file')
     
@@ -1,5 +1,4 @@
 import os
-import json
 import pandas as pd
 import logging
 import time
@@ -10,7 +9,7 @@ from datetime import datetime, timedelta
 from collections import deque
 
 # 导入稳定的JSON解析器
-from .llm_json_parser import parse_llm_json
+from .llm_json_parser import json_loads, parse_llm_json
 
 logger = logging.getLogger(__name__)
 
@@ -386,7 +385,6 @@ class UniversalEnricher:
         """
         Ollama 专用的宽松 JSON 解析器
         """
-        import json
         import re
         
         if not text:
@@ -397,7 +395,7 @@ class UniversalEnricher:
         # 尝试多种解析方式
         # 1. 直接解析
         try:
-            data = json.loads(text)
+            data = json_loads(text)
             if isinstance(data, dict):
                 return self._normalize_data(data, expected_keys)
         except:
@@ -411,7 +409,7 @@ class UniversalEnricher:
         cleaned = re.sub(r'[^}]*$', '', cleaned)  # 移除 } 之后的内容
         
         try:
-            data = json.loads(cleaned)
+            data = json_loads(cleaned)
             if isinstance(data, dict):
                 return self._normalize_data(data, expected_keys)
         except:
@@ -425,7 +423,7 @@ class UniversalEnricher:
                 json_str = match.group()
                 json_str = json_str.replace('"', '"').replace('"', '"')
                 json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
-                data = json.loads(json_str)
+                data = json_loads(json_str)
                 if isinstance(data, dict):
                     return self._normalize_data(data, expected_keys)
             except:
@@ -489,7 +487,6 @@ class UniversalEnricher:
         """
         简化的JSON解析器 - 5层解析策略
         """
-        import json
         import re
         
         if not text:
@@ -500,7 +497,7 @@ class UniversalEnricher:
         
         # 策略1: 直接解析
         try:
-            data = json.loads(text)
+            data = json_loads(text)
             if isinstance(data, dict):
                 logger.debug("✓ 策略1成功: 直接JSON解析")
                 return self._normalize_data(data, expected_keys)
@@ -512,7 +509,7 @@ class UniversalEnricher:
             cleaned = re.sub(r'```json\s*', '', text)
             cleaned = re.sub(r'```\s*', '', cleaned)
             cleaned = cleaned.strip()
-            data = json.loads(cleaned)
+            data = json_loads(cleaned)
             if isinstance(data, dict):
                 logger.debug("✓ 策略2成功: 移除markdown后解析")
                 return self._normalize_data(data, expected_keys)
@@ -523,7 +520,7 @@ class UniversalEnricher:
         try:
             match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', text, re.DOTALL)
             if match:
-                data = json.loads(match.group())
+                data = json_loads(match.group())
                 if isinstance(data, dict):
                     logger.debug("✓ 策略3成功: 提取{}块")
                     return self._normalize_data(data, expected_keys)
@@ -533,7 +530,7 @@ class UniversalEnricher:
         # 策略4: 修复常见JSON问题后解析
         try:
             fixed = self._fix_json_issues(text)
-            data = json.loads(fixed)
+            data = json_loads(fixed)
             if isinstance(data, dict):
                 logger.debug("✓ 策略4成功: 修复JSON问题")
                 return self._normalize_data(data, expected_keys)
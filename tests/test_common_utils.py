@@ -0,0 +1,74 @@
+"""
+common_utils 测试
+"""
+
+import functools
+import pickle
+import threading
+
+import pandas as pd
+import pytest
+
+from modules.common_utils import CachedStateMixin, resolve_workers, run_chunked
+
+
+class _Cached(CachedStateMixin):
+    _TRANSIENT_ATTRS = ('_square_cached', '_local')
+    
+    def __init__(self):
+        self.offset = 1
+        self._init_caches()
+    
+    def _init_caches(self):
+        self._square_cached = functools.lru_cache(maxsize=None)(self._square)
+        self._local = threading.local()
+    
+    def _square(self, x):
+        return x * x + self.offset
+
+
+def _double(items):
+    return [2 * item for item in items]
+
+
+def _row_ids(df):
+    return list(df.index)
+
+
+def test_resolve_workers():
+    assert resolve_workers(3) == 3
+    assert resolve_workers(-1) >= 1
+
+
+def test_run_chunked_list_keeps_order():
+    items = list(range(103))
+    assert run_chunked(_double, items, n_jobs=2) == _double(items)
+
+
+def test_run_chunked_dataframe_uses_positional_chunks():
+    df = pd.DataFrame({'a': range(50)}, index=range(100, 150))
+    assert run_chunked(_row_ids, df, n_jobs=3) == list(range(100, 150))
+
+
+def test_run_chunked_small_input_runs_in_process():
+    assert run_chunked(lambda items: ['local'], [1, 2, 3], n_jobs=4, min_items=10) == ['local']
+
+
+def test_cached_state_mixin_rebuilds_transient_attrs():
+    obj = _Cached()
+    obj.offset = 2
+    assert obj._square_cached(3) == 11
+    
+    copy = pickle.loads(pickle.dumps(obj))
+    assert copy.offset == 2
+    assert copy._square_cached(3) == 11
+    assert copy._square_cached.cache_info().misses == 1
+    assert isinstance(copy._local, threading.local)
+
+
+def test_cached_state_mixin_requires_init_caches():
+    class _Missing(CachedStateMixin):
+        pass
+    
+    with pytest.raises(TypeError):
+        _Missing()
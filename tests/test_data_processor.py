@@ -0,0 +1,32 @@
+"""
+DataProcessor 测试
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from modules.graph_construction.data_processor import DataProcessor
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / 'modules' / 'graph_construction' / 'config' / 'config.yaml'
+
+
+def test_process_attributes_skips_failing_rows_only(monkeypatch):
+    processor = DataProcessor(str(CONFIG_PATH))
+    df = pd.DataFrame({
+        '品名': ['乙醇', '甲醇', '丙酮'],
+        '别名': ['酒精', 'BAD', '二甲基酮'],
+        '闪点': ['13℃', '11℃', '-20℃'],
+    }, index=[10, 11, 12])
+    
+    split_aliases = processor.splitter.split_aliases
+    def failing_split_aliases(text):
+        if text == 'BAD':
+            raise ValueError('bad alias')
+        return split_aliases(text)
+    monkeypatch.setattr(processor.splitter, 'split_aliases', failing_split_aliases)
+    
+    records = processor.process_attributes(df, n_jobs=1)
+    assert [record['原始行号'] for record in records] == [10, 12]
+    assert [record['basic_info']['品名'] for record in records] == ['乙醇', '丙酮']
+    assert records[1]['physical_properties']['闪点'][0]['value'] == -20.0
@@ -0,0 +1,35 @@
+"""
+RobustLLMJsonParser 测试
+"""
+
+import pickle
+
+from modules.llm_json_parser import RobustLLMJsonParser, _iter_json_candidates
+
+
+MIXED_TEXT = 'Example: {"a": 1}\n```json\n{"b": 2}\n```'
+
+
+def test_result_does_not_depend_on_earlier_inputs():
+    fresh = RobustLLMJsonParser().parse(MIXED_TEXT, validate=False)
+    
+    parser = RobustLLMJsonParser()
+    parser.parse('Note {"x": 1}\n```json\n{broken\n```', validate=False)
+    assert parser.parse(MIXED_TEXT, validate=False) == fresh == {'b': 2}
+
+
+def test_parser_survives_pickle():
+    parser = pickle.loads(pickle.dumps(RobustLLMJsonParser()))
+    assert parser.parse('```json\n{"a": 1}\n```', validate=False) == {'a': 1}
+
+
+def test_candidates_inside_unclosed_leading_brace():
+    assert list(_iter_json_candidates('{ a {"b": 1} { c {"d": 2} [3] ')) == ['{"b": 1}', '{"d": 2}', '[3]']
+    assert list(_iter_json_candidates('{"x": 1} {{ [2]')) == ['{"x": 1}', '[2]']
+    assert list(_iter_json_candidates('{ {"a": {"b": 1}}', '{')) == ['{"a": {"b": 1}}']
+
+
+def test_object_after_unclosed_leading_brace_is_parsed():
+    text = '{ 结果如下 {"名称": "乙醇", "性质": {"沸点": 78, "熔点": -114}}'
+    result = RobustLLMJsonParser().parse(text, validate=False)
+    assert result == {'名称': '乙醇', '性质': {'沸点': 78, '熔点': -114}}
@@ -0,0 +1,34 @@
+"""
+Neo4j 导出 CSV 写出测试
+"""
+
+import codecs
+
+import pandas as pd
+
+from modules.graph_construction.neo4j_exporter import _write_csv
+
+
+def test_write_csv_falls_back_for_nested_cells(tmp_path):
+    path = tmp_path / 'nodes.csv'
+    df = pd.DataFrame({'name': ['乙醇', '水'], 'aliases': [['酒精'], ['H2O', '一氧化二氢']]})
+
+    _write_csv(df, str(path))
+
+    raw = path.read_bytes()
+    assert raw.startswith(codecs.BOM_UTF8)
+    assert not raw[len(codecs.BOM_UTF8):].startswith(codecs.BOM_UTF8)
+    written = pd.read_csv(path, encoding='utf-8-sig')
+    assert written['name'].tolist() == ['乙醇', '水']
+    assert written['aliases'].tolist() == ["['酒精']", "['H2O', '一氧化二氢']"]
+
+
+def test_write_csv_flat_frame(tmp_path):
+    path = tmp_path / 'rels.csv'
+    df = pd.DataFrame({':START_ID': ['n1'], ':END_ID': ['n2'], ':TYPE': ['HAS_PROPERTY']})
+
+    _write_csv(df, str(path))
+
+    assert path.read_bytes().startswith(codecs.BOM_UTF8)
+    written = pd.read_csv(path, encoding='utf-8-sig')
+    assert written.to_dict('records') == df.to_dict('records')
@@ -0,0 +1,45 @@
+"""
+CheckpointManager 测试
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.pipeline_manager import CheckpointManager
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({'id': np.arange(100), 'score': np.linspace(0, 1, 100), 'name': [f'n{i}' for i in range(100)]})
+
+
+def test_dataframe_checkpoint_round_trip(tmp_path, frame):
+    manager = CheckpointManager(str(tmp_path))
+    manager.save_dataframe_checkpoint('stage', frame, list(range(0, 100, 2)), {'batch': 3})
+    
+    checkpoint = manager.load_dataframe_checkpoint('stage')
+    assert checkpoint['metadata'] == {'batch': 3}
+    assert np.flatnonzero(CheckpointManager.processed_mask(checkpoint, len(frame))).tolist() == list(range(0, 100, 2))
+    pd.testing.assert_frame_equal(checkpoint['partial_df'], frame.iloc[::2].reset_index(drop=True))
+
+
+def test_dataframe_checkpoint_resave_while_loaded(tmp_path, frame):
+    manager = CheckpointManager(str(tmp_path))
+    manager.save_dataframe_checkpoint('stage', frame, list(range(100)))
+    loaded = manager.load_dataframe_checkpoint('stage')['partial_df']
+    
+    # 重新保存不能破坏仍在使用的映射数据
+    manager.save_dataframe_checkpoint('stage', loaded, list(range(10)))
+    pd.testing.assert_frame_equal(loaded, frame)
+    assert len(manager.load_dataframe_checkpoint('stage')['partial_df']) == 10
+    assert sorted(path.name for path in tmp_path.glob('stage_partial*')) == ['stage_partial.feather']
+
+
+def test_dataframe_checkpoint_falls_back_to_csv(tmp_path, frame):
+    manager = CheckpointManager(str(tmp_path))
+    manager.save_dataframe_checkpoint('stage', frame, list(range(100)))
+    manager.save_dataframe_checkpoint('stage', pd.DataFrame({'mixed': [1, 'a', 2.5]}), [0, 1, 2])
+    
+    assert sorted(path.name for path in tmp_path.glob('stage_partial*')) == ['stage_partial.csv']
+    assert manager.load_dataframe_checkpoint('stage')['partial_df'].shape == (3, 1)
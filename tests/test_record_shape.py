@@ -0,0 +1,77 @@
+"""
+处理结果结构测试：AttributeSplitter 产出的记录结构，以及 DataProcessor / Neo4jExporter 对它的使用
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from modules.graph_construction.data_processor import DataProcessor
+from modules.graph_construction.neo4j_exporter import Neo4jExporter
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / 'modules' / 'graph_construction' / 'config' / 'config.yaml'
+
+ROW = {
+    '品名': '乙醇',
+    'CAS号': '64-17-5',
+    '闪点': '13℃',
+    '爆炸极限（LEL/UEL）': 'LEL 3.3% UEL 19%',
+    '物理危害': '易燃液体;蒸气可燃',
+    '健康危害': '吸入引起头痛；皮肤刺激',
+}
+
+
+@pytest.fixture(scope='module')
+def processor():
+    return DataProcessor(str(CONFIG_PATH))
+
+
+@pytest.fixture(scope='module')
+def record(processor):
+    return processor.splitter.process_row(ROW)
+
+
+def test_physical_properties_are_lists_of_dicts(record):
+    properties = record['physical_properties']
+    assert properties['爆炸极限'] == [{'LEL': 3.3, 'UEL': 19.0}]
+    for values in properties.values():
+        assert isinstance(values, list)
+        assert all(type(value) is dict for value in values)
+
+
+def test_hazard_categories_shape(record):
+    hazards = record['hazards']
+    assert hazards['物理危害'] == ['易燃液体', '蒸气可燃']
+    assert type(hazards['健康危害']) is dict
+    for descriptions in hazards['健康危害'].values():
+        assert isinstance(descriptions, list)
+
+
+def test_frame_extraction_matches_row_extraction(processor, record):
+    results = processor.splitter._process_chunk(pd.DataFrame([ROW]))
+    assert results == [(0, record, None)]
+
+
+def test_flatten_record_columns(processor, record):
+    flat = processor.flatten_record(record)
+    assert flat['爆炸极限_1_LEL'] == 3.3
+    assert flat['爆炸极限_1_UEL'] == 19.0
+    assert flat['闪点_1_value'] == 13.0
+    assert flat['危害_物理危害'] == '易燃液体; 蒸气可燃'
+    assert flat['危害_健康危害_皮肤刺激'] == '皮肤刺激'
+    assert '爆炸极限_LEL' not in flat
+
+
+def test_exporter_handles_explosion_limits_and_hazard_categories(record):
+    exporter = Neo4jExporter()
+    chemical_id = exporter.create_chemical_nodes([record])['乙醇']
+    exporter._emit_properties(chemical_id, record)
+    exporter._emit_hazards(chemical_id, record)
+    
+    limits = [node for node in exporter.node_props if node.get('属性名') == '爆炸极限']
+    assert len(limits) == 1
+    assert limits[0]['LEL'] == 3.3 and limits[0]['UEL'] == 19.0
+    
+    hazard_types = {node['危害类型'] for node in exporter.node_props if '危害类型' in node}
+    assert hazard_types == {'物理危害', '健康危害_皮肤刺激', '健康危害_呼吸道刺激'}
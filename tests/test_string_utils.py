@@ -0,0 +1,26 @@
+"""
+StringUtils 测试
+"""
+
+import pytest
+
+from modules.data_enrichment.utils.string_utils import StringUtils
+
+
+@pytest.mark.parametrize('name, expected', [
+    ('分析纯乙醇', '乙醇'),
+    ('AR 乙醇', '乙醇'),
+    ('分析纯 AR 乙醇', '乙醇'),
+    ('化学纯CP 丙酮', '丙酮'),
+    ('GR AR CP 甲苯', '甲苯'),
+])
+def test_normalize_chemical_name_strips_grade_prefixes(name, expected):
+    assert StringUtils.normalize_chemical_name(name) == expected
+
+
+def test_normalize_chemical_name_keeps_inner_grade_text():
+    assert StringUtils.normalize_chemical_name('乙醇 AR') == '乙醇 AR'
+
+
+def test_normalize_chemical_name_normalizes_brackets():
+    assert StringUtils.normalize_chemical_name('分析纯 AR 氯化钠（固体）') == '氯化钠(固体)'
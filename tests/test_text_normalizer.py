@@ -0,0 +1,74 @@
+"""
+TextNormalizer 测试
+"""
+
+import pytest
+
+from modules.graph_construction import text_normalizer
+from modules.graph_construction.text_normalizer import TextNormalizer
+
+
+@pytest.fixture(params=['automaton', 'regex'])
+def normalizer(request, monkeypatch):
+    """分别使用 Aho-Corasick 自动机和交替正则两种替换匹配器"""
+    if request.param == 'automaton':
+        if text_normalizer.ahocorasick is None:
+            pytest.skip('pyahocorasick not installed')
+    else:
+        monkeypatch.setattr(text_normalizer, 'ahocorasick', None)
+    
+    normalizer = TextNormalizer()
+    normalizer.synonyms_map = {'透明': '无色', '无色透明': '无色', '液态': '液体', 'colourless': 'colorless'}
+    normalizer.unit_map = {'Pa': 'kPa', 'kPa': 'kPa', 'hPa': 'kPa', 'mmHg': 'kPa', '℃': '°C'}
+    normalizer.compile_replacements()
+    return normalizer
+
+
+def test_units_replaced_text_is_not_rescanned(normalizer):
+    assert normalizer.normalize_units('101 kPa') == '101 kPa'
+    assert normalizer.normalize_units('5 Pa, 3 hPa') == '5 kPa, 3 kPa'
+    assert normalizer.normalize_units('760 mmHg 25℃') == '760 kPa 25°C'
+
+
+def test_synonyms_longest_term_wins(normalizer):
+    assert normalizer.normalize_text('无色透明液态') == '无色液体'
+    assert normalizer.normalize_text('透明') == '无色'
+    assert normalizer.normalize_text(' colourless liquid ') == 'colorless liquid'
+
+
+def test_normalize_text_missing_values(normalizer):
+    for text in ['', 'N/A', '处理异常', 'null', '   ']:
+        assert normalizer.normalize_text(text) is None
+
+
+def test_compile_replacements_drops_cached_results(normalizer):
+    assert normalizer.normalize_text('液态') == '液体'
+    normalizer.synonyms_map['液态'] = 'liquid'
+    normalizer.compile_replacements()
+    assert normalizer.normalize_text('液态') == 'liquid'
+
+
+@pytest.mark.parametrize('min_jaccard', [0.0, 0.3, 0.5, 0.8, 1.0])
+def test_blocked_candidates_match_brute_force_jaccard(monkeypatch, min_jaccard):
+    names = ['乙酸乙酯', '乙酸甲酯', '乙基苯', '甲基苯', '氯化钠', '氯化钾', '乙酸', '乙醇',
+             '二氯乙烷', '1,2-二氯乙烷', 'ethyl acetate', 'Ethyl Acetate', 'methyl acetate', 'a', '']
+    normalizer = TextNormalizer()
+    shingles = [normalizer._name_shingles(name, 2) for name in names]
+    
+    # 让每个名称的候选原样成组，直接比较候选集合
+    seen = {}
+    def record_candidates(name, candidates, threshold=80):
+        seen[name] = candidates
+        return [name]
+    monkeypatch.setattr(normalizer, 'find_similar_terms', record_candidates)
+    normalizer.find_similar_groups_blocked(names, min_jaccard=min_jaccard)
+    
+    for i, name in enumerate(names):
+        if not name:
+            continue
+        expected = [
+            names[j] for j in range(len(names))
+            if shingles[i] & shingles[j]
+            and len(shingles[i] & shingles[j]) / len(shingles[i] | shingles[j]) >= min_jaccard
+        ]
+        assert seen[name] == expected
@@ -0,0 +1,79 @@
+"""
+ValidationUtils 测试
+"""
+
+import time
+
+import pandas as pd
+import pytest
+
+from modules.data_enrichment.utils.validation_utils import ValidationUtils
+
+
+@pytest.mark.parametrize('formula', ['H2O', 'C6H12O6', 'NaCl', 'CH3COOH', 'C2H5OH', 'Fe2O3', ' H2SO4 '])
+def test_molecular_formula_accepts_normal_formulas(formula):
+    assert ValidationUtils.is_valid_molecular_formula(formula)
+
+
+@pytest.mark.parametrize('formula', ['O2', 'H2', 'N2', 'He', 'C'])
+def test_molecular_formula_accepts_single_element(formula):
+    assert ValidationUtils.is_valid_molecular_formula(formula)
+
+
+@pytest.mark.parametrize('formula', ['', 'h2o', '2H2O', 'H2O!', 'H-O', 'Abc', None, 123])
+def test_molecular_formula_rejects_invalid(formula):
+    assert not ValidationUtils.is_valid_molecular_formula(formula)
+
+
+@pytest.mark.parametrize('text', ['A' * 200 + '!', 'C12' * 40 + '!', 'Na1' * 60 + 'x'])
+def test_molecular_formula_pathological_input_is_fast(text):
+    start = time.perf_counter()
+    assert not ValidationUtils.MOLECULAR_FORMULA_PATTERN.match(text)
+    assert time.perf_counter() - start < 0.5
+
+
+@pytest.mark.parametrize('url', [
+    'http://example.com',
+    'https://a.b.org/x?y=1',
+    'http://localhost:8080/a',
+    'http://192.168.0.1/',
+    ' https://example.org ',
+])
+def test_url_accepts_http_urls(url):
+    assert ValidationUtils.is_valid_url(url)
+    assert ValidationUtils.is_valid_url(url, strict=True)
+
+
+@pytest.mark.parametrize('url', ['ftp://example.com', 'example.com', 'http://', 'https:///path', 'http://[::1', '', None])
+def test_url_rejects_missing_scheme_or_host(url):
+    assert not ValidationUtils.is_valid_url(url)
+    assert not ValidationUtils.is_valid_url(url, strict=True)
+
+
+def test_url_strict_checks_host_format():
+    url = 'http://not_a_domain/path'
+    assert ValidationUtils.is_valid_url(url)
+    assert not ValidationUtils.is_valid_url(url, strict=True)
+
+
+def test_url_long_input_is_fast():
+    url = 'http://example.com/' + 'a' * 100000 + ' !'
+    start = time.perf_counter()
+    assert ValidationUtils.is_valid_url(url)
+    assert time.perf_counter() - start < 0.5
+
+
+CAS_TEXT = '乙醇 64-17-5，水 7732-18-5，错误 64-17-6，苯 71-43-2；' * 10
+
+
+def test_extract_cas_numbers_from_text_batch_and_single_paths_agree():
+    expected = ['64-17-5', '7732-18-5', '71-43-2'] * 10
+    assert ValidationUtils.extract_cas_numbers_from_text(CAS_TEXT) == expected
+    assert ValidationUtils.extract_cas_numbers_from_text(CAS_TEXT[:CAS_TEXT.index('；') + 1]) == expected[:3]
+
+
+def test_extract_cas_numbers_from_series():
+    series = pd.Series([CAS_TEXT, None, '无', '50-00-0 和 50-00-1'], index=[3, 3, 1, 0])
+    result = ValidationUtils.extract_cas_numbers_from_series(series)
+    assert result.index.tolist() == [3, 3, 1, 0]
+    assert result.tolist() == [['64-17-5', '7732-18-5', '71-43-2'] * 10, [], [], ['50-00-0']]